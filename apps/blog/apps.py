@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class BlogConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.blog'
\ No newline at end of file
+    name = 'apps.blog'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,26 @@
+"""Custom model fields for the blog application."""
+
+from django.db import models
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+class FastJSONField(models.JSONField):
+    """JSONField that decodes database values with orjson when available.
+
+    Falls back to Django's stdlib ``json`` handling when orjson is not
+    installed or a custom decoder is configured on the field.
+    """
+
+    def from_db_value(self, value, expression, connection):
+        if orjson is None or self.decoder is not None:
+            return super().from_db_value(value, expression, connection)
+        if not isinstance(value, (str, bytes)):
+            return super().from_db_value(value, expression, connection)
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return value
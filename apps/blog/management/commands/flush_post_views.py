@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from apps.blog.models import Post
+
+
+class Command(BaseCommand):
+    help = "Write buffered post view counts from Redis to the database."
+
+    def handle(self, *args, **options):
+        updated = Post.flush_view_counts()
+        self.stdout.write(
+            self.style.SUCCESS(f"Flushed view counts for {updated} posts")
+        )
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from apps.blog.models import Subscriber
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored tenure bucket of newsletter subscribers."
+
+    def handle(self, *args, **options):
+        updated = Subscriber.refresh_subscribed_buckets()
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed tenure buckets for {updated} subscribers")
+        )
@@ -1,9 +1,282 @@
-from django.db import models
-
-
-# write custom manager for published posts
-class PublishedManager(models.Manager):
-    """Custom manager for published posts."""
-
-    def get_queryset(self):
-        return super().get_queryset().filter(status="published")
+import base64
+import hashlib
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import models
+from django.db.models import Prefetch, Q
+from django.utils.dateparse import parse_datetime
+from django.db.models.query import ModelIterable
+
+PUBLISHED_CACHE_VERSION_KEY = "blog:published:version"
+PUBLISHED_CACHE_TIMEOUT = 300
+
+
+def get_published_cache_version():
+    """Return the current namespace version for cached published querysets."""
+    return cache.get_or_set(PUBLISHED_CACHE_VERSION_KEY, 1, None)
+
+
+def encode_post_cursor(post):
+    """Opaque keyset cursor for a post: its ``published_at`` and id."""
+    raw = f"{post.published_at.isoformat()}|{post.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_post_cursor(cursor):
+    """Inverse of :func:`encode_post_cursor`; raises ``ValueError`` if bad."""
+    try:
+        published_at, pk = base64.urlsafe_b64decode(cursor).decode().split("|")
+        published_at = parse_datetime(published_at)
+        if published_at is None:
+            raise ValueError
+        return published_at, int(pk)
+    except (TypeError, ValueError, UnicodeDecodeError) as exc:
+        raise ValueError(f"Invalid post cursor: {cursor!r}") from exc
+
+
+def invalidate_published_cache():
+    """Bump the namespace version so every cached published queryset expires."""
+    try:
+        cache.incr(PUBLISHED_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(PUBLISHED_CACHE_VERSION_KEY, 1, None)
+
+
+class PublishedQuerySet(models.QuerySet):
+    """Chainable queryset helpers for published posts.
+
+    Evaluated results are cached under a key derived from the compiled SQL
+    and its parameters. The key is namespaced by a version number that is
+    bumped whenever a post, category or tag changes.
+    """
+
+    def with_comments(self):
+        """Prefetch approved comments together with their authors."""
+        comment_model = self.model._meta.get_field("comments").related_model
+        return self.prefetch_related(
+            Prefetch(
+                "comments",
+                queryset=comment_model.objects.filter(is_approved=True)
+                .select_related("author")
+                .order_by("-created_at"),
+            )
+        )
+
+    def for_listing(self):
+        """Load only the columns list views render, skipping body text."""
+        return self.only(
+            "id",
+            "slug",
+            "title",
+            "author",
+            "category",
+            "published_at",
+            "created_at",
+        )
+
+    def stream(self, chunk_size=2000):
+        """Iterate over posts in chunks for large exports (RSS, sitemaps).
+
+        Relations are not joined or prefetched and results are not cached,
+        so memory stays bounded by ``chunk_size``.
+        """
+        return (
+            self.select_related(None)
+            .prefetch_related(None)
+            .only("id", "slug", "title", "published_at", "updated_at")
+            .iterator(chunk_size=chunk_size)
+        )
+
+    def page_after(self, cursor=None, first=20):
+        """Return up to ``first`` posts following ``cursor``, newest first.
+
+        Keyset pagination over ``(published_at, id)``: each page is a range
+        scan of the post_recent_idx index, however deep it is. Posts without
+        a ``published_at`` have no cursor position and are left out.
+        """
+        queryset = self.filter(published_at__isnull=False).order_by(
+            "-published_at", "-pk"
+        )
+        if cursor:
+            published_at, pk = decode_post_cursor(cursor)
+            queryset = queryset.filter(
+                Q(published_at__lt=published_at)
+                | Q(published_at=published_at, pk__lt=pk),
+                # Redundant bound that lets the index range scan start at the cursor
+                published_at__lte=published_at,
+            )
+        return queryset[:first]
+
+    def _prefetch_cache_key(self):
+        """Stable description of the prefetches (Prefetch reprs hold addresses)."""
+        parts = []
+        for lookup in self._prefetch_related_lookups:
+            if isinstance(lookup, Prefetch):
+                parts.append(lookup.prefetch_to)
+                if lookup.queryset is not None:
+                    parts.append(str(lookup.queryset.query.sql_with_params()))
+            else:
+                parts.append(lookup)
+        return "|".join(parts)
+
+    def _result_cache_key(self):
+        if self._iterable_class is not ModelIterable or self.query.select_for_update:
+            return None
+        try:
+            sql, params = self.query.sql_with_params()
+            prefetches = self._prefetch_cache_key()
+        except EmptyResultSet:
+            return None
+        digest = hashlib.sha1(f"{sql}:{params}:{prefetches}".encode()).hexdigest()
+        return f"blog:published:{get_published_cache_version()}:{digest}"
+
+    def _fetch_all(self):
+        if self._result_cache is None:
+            key = self._result_cache_key()
+            if key is not None:
+                cached = cache.get(key)
+                if cached is not None:
+                    self._result_cache = cached
+                    self._prefetch_done = True
+                    return
+                super()._fetch_all()
+                cache.set(key, self._result_cache, PUBLISHED_CACHE_TIMEOUT)
+                return
+        super()._fetch_all()
+
+
+# write custom manager for published posts
+class PublishedManager(models.Manager.from_queryset(PublishedQuerySet)):
+    """Custom manager for published posts."""
+
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .filter(status=self.model.Status.PUBLISHED)
+            .select_related("author", "category")
+            .prefetch_related("tags")
+            .order_by("-published_at")
+        )
+
+
+class ActiveCachedManager(models.Manager):
+    """Manager exposing the active rows as a cached list of id/slug/name."""
+
+    ACTIVE_CACHE_TIMEOUT = 3600
+
+    @property
+    def active_cache_key(self):
+        return f"blog:{self.model._meta.model_name}:active"
+
+    def active_cached(self):
+        """Return active rows as dicts, read through the cache."""
+        return cache.get_or_set(
+            self.active_cache_key,
+            lambda: list(
+                self.filter(is_active=True)
+                .order_by("name")
+                .values("id", "slug", "name")
+            ),
+            self.ACTIVE_CACHE_TIMEOUT,
+        )
+
+    def active_ids(self):
+        """Return the primary keys of active rows from the cached list."""
+        return [row["id"] for row in self.active_cached()]
+
+    def invalidate_active_cache(self):
+        cache.delete(self.active_cache_key)
+
+
+class SubscriberManager(models.Manager):
+    """Manager for newsletter subscribers with batched writes."""
+
+    def bulk_subscribe(self, emails, batch_size=1000):
+        """Insert subscribers in batches, skipping emails that already exist.
+
+        Returns the number of subscribers inserted. Known emails are filtered
+        out first; ``ignore_conflicts`` only guards against the same email
+        being inserted concurrently, in which case it is still counted.
+        """
+        emails = list(dict.fromkeys(emails))
+        inserted = 0
+        for start in range(0, len(emails), batch_size):
+            batch = emails[start : start + batch_size]
+            existing = set(self.filter(email__in=batch).values_list("email", flat=True))
+            subscribers = [
+                self.model(email=email) for email in batch if email not in existing
+            ]
+            self.bulk_create(subscribers, ignore_conflicts=True)
+            inserted += len(subscribers)
+        return inserted
+
+
+class CommentQuerySet(models.QuerySet):
+    """Comment querysets whose bulk updates keep denormalized counts in step."""
+
+    # Fields whose change can move a post's approved comment count
+    POST_COUNT_FIELDS = frozenset({"is_approved", "post", "post_id"})
+    # Fields whose change can move an author's comment count
+    AUTHOR_COUNT_FIELDS = frozenset({"author", "author_id"})
+
+    def update(self, **kwargs):
+        # update() skips post_save, so refresh the denormalized counts here
+        posts_moved = not self.POST_COUNT_FIELDS.isdisjoint(kwargs)
+        authors_moved = not self.AUTHOR_COUNT_FIELDS.isdisjoint(kwargs)
+        if not (posts_moved or authors_moved):
+            return super().update(**kwargs)
+        rows = list(self.values_list("post_id", "author_id"))
+        updated = super().update(**kwargs)
+        if not rows:
+            return updated
+        if posts_moved:
+            post_ids = {post_id for post_id, _ in rows}
+            new_post = kwargs.get("post", kwargs.get("post_id"))
+            if new_post is not None:
+                post_ids.add(getattr(new_post, "pk", new_post))
+            post_model = self.model._meta.get_field("post").related_model
+            post_model.refresh_comment_count(post_ids)
+            invalidate_published_cache()
+        if authors_moved:
+            from .models import AuthorStats
+
+            author_ids = {author_id for _, author_id in rows}
+            new_author = kwargs.get("author", kwargs.get("author_id"))
+            new_author_id = getattr(new_author, "pk", new_author)
+            AuthorStats.objects.get_or_create(user_id=new_author_id)
+            AuthorStats.refresh_comment_count(author_ids | {new_author_id})
+        return updated
+
+
+class CommentManager(models.Manager.from_queryset(CommentQuerySet)):
+    """Manager for comments with threading and batched moderation."""
+
+    THREAD_FIELDS = ("id", "post", "parent", "author", "content", "created_at")
+
+    def threaded(self, post_id):
+        """Approved top-level comments of a post with their approved replies.
+
+        Replies are fetched with one extra query, projected to the columns a
+        thread needs (including the post and parent keys used for stitching).
+        """
+        replies = (
+            self.filter(is_approved=True)
+            .only(*self.THREAD_FIELDS)
+            .select_related("author")
+            .order_by("-created_at")
+        )
+        return (
+            self.filter(post_id=post_id, parent__isnull=True, is_approved=True)
+            .select_related("author")
+            .prefetch_related(Prefetch("replies", queryset=replies))
+            .order_by("-created_at")
+        )
+
+    def bulk_approve(self, ids):
+        """Approve many comments with a single UPDATE.
+
+        Post comment counts are refreshed by ``CommentQuerySet.update()``.
+        """
+        return self.filter(pk__in=ids, is_approved=False).update(is_approved=True)
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.25 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0005_remove_blogsettings_enable_newsletter_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="post",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True, db_index=True, verbose_name="Créer le"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["status", "-created_at"], name="post_status_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["-published_at"], name="post_published_at_idx"
+            ),
+        ),
+    ]
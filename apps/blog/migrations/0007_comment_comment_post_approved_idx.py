@@ -0,0 +1,20 @@
+# Generated by Django 4.2.25 on 2026-10-15 09:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0006_alter_post_created_at_post_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["post", "is_approved", "-created_at"],
+                name="comment_post_approved_idx",
+            ),
+        ),
+    ]
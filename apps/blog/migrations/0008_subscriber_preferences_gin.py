@@ -0,0 +1,26 @@
+# Generated by Django 4.2.25 on 2026-10-15 09:30
+
+import apps.blog.fields
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0007_comment_comment_post_approved_idx"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="subscriber",
+            name="preferences",
+            field=apps.blog.fields.FastJSONField(blank=True, default=dict),
+        ),
+        migrations.AddIndex(
+            model_name="subscriber",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["preferences"], name="subscriber_preferences_gin"
+            ),
+        ),
+    ]
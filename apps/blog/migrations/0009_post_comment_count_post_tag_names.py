@@ -0,0 +1,48 @@
+# Generated by Django 4.2.25 on 2026-10-15 09:45
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+def backfill_denormalized_fields(apps, schema_editor):
+    Post = apps.get_model("blog", "Post")
+    Comment = apps.get_model("blog", "Comment")
+    for post in Post.objects.all().iterator():
+        post.comment_count = Comment.objects.filter(
+            post_id=post.pk, is_approved=True
+        ).count()
+        post.tag_names = list(
+            post.tags.order_by("name").values_list("name", flat=True)
+        )
+        post.save(update_fields=["comment_count", "tag_names"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0008_subscriber_preferences_gin"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="comment_count",
+            field=models.PositiveIntegerField(
+                db_index=True, default=0, editable=False
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="tag_names",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=50),
+                blank=True,
+                default=list,
+                editable=False,
+                size=None,
+            ),
+        ),
+        migrations.RunPython(
+            backfill_denormalized_fields, migrations.RunPython.noop
+        ),
+    ]
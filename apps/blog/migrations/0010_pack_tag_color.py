@@ -0,0 +1,59 @@
+# Generated by Django 4.2.25 on 2026-10-15 10:00
+
+import django.core.validators
+from django.db import migrations, models
+
+
+def hex_to_int(apps, schema_editor):
+    Tag = apps.get_model("blog", "Tag")
+    tags = list(Tag.objects.only("pk", "color"))
+    for tag in tags:
+        digits = (tag.color or "").lstrip("#")
+        if len(digits) == 3:
+            digits = "".join(ch * 2 for ch in digits)
+        try:
+            tag.color_packed = int(digits, 16) & 0xFFFFFF
+        except ValueError:
+            tag.color_packed = 0
+    Tag.objects.bulk_update(tags, ["color_packed"], batch_size=1000)
+
+
+def int_to_hex(apps, schema_editor):
+    Tag = apps.get_model("blog", "Tag")
+    tags = list(Tag.objects.only("pk", "color_packed"))
+    for tag in tags:
+        tag.color = f"#{tag.color_packed:06x}"
+    Tag.objects.bulk_update(tags, ["color"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0009_post_comment_count_post_tag_names"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tag",
+            name="color_packed",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(hex_to_int, int_to_hex),
+        migrations.RemoveField(
+            model_name="tag",
+            name="color",
+        ),
+        migrations.RenameField(
+            model_name="tag",
+            old_name="color_packed",
+            new_name="color",
+        ),
+        migrations.AlterField(
+            model_name="tag",
+            name="color",
+            field=models.PositiveIntegerField(
+                default=0,
+                validators=[django.core.validators.MaxValueValidator(16777215)],
+            ),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 4.2.25 on 2026-10-15 10:15
+
+from django.db import migrations, models
+
+STATUS_VALUES = {"draft": 0, "published": 1, "archived": 2}
+
+
+def status_to_int(apps, schema_editor):
+    Post = apps.get_model("blog", "Post")
+    for name, value in STATUS_VALUES.items():
+        Post.objects.filter(status=name).update(status_code=value)
+
+
+def status_to_str(apps, schema_editor):
+    Post = apps.get_model("blog", "Post")
+    for name, value in STATUS_VALUES.items():
+        Post.objects.filter(status_code=value).update(status=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0010_pack_tag_color"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="post",
+            name="post_status_created_idx",
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="status_code",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(status_to_int, status_to_str),
+        migrations.RemoveField(
+            model_name="post",
+            name="status",
+        ),
+        migrations.RenameField(
+            model_name="post",
+            old_name="status_code",
+            new_name="status",
+        ),
+        migrations.AlterField(
+            model_name="post",
+            name="status",
+            field=models.PositiveSmallIntegerField(
+                choices=[(0, "Draft"), (1, "Published"), (2, "Archived")],
+                default=0,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["status", "-created_at"], name="post_status_created_idx"
+            ),
+        ),
+    ]
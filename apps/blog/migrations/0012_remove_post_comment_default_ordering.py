@@ -0,0 +1,21 @@
+# Generated by Django 4.2.25 on 2026-10-15 10:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0011_post_status_smallint"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="comment",
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name="post",
+            options={},
+        ),
+    ]
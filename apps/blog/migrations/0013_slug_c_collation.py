@@ -0,0 +1,28 @@
+# Generated by Django 4.2.25 on 2026-10-15 10:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0012_remove_post_comment_default_ordering"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="category",
+            name="slug",
+            field=models.SlugField(db_collation="C", unique=True),
+        ),
+        migrations.AlterField(
+            model_name="post",
+            name="slug",
+            field=models.SlugField(db_collation="C", unique=True, verbose_name="Slug"),
+        ),
+        migrations.AlterField(
+            model_name="tag",
+            name="slug",
+            field=models.SlugField(db_collation="C", unique=True),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.25 on 2026-10-15 11:00
+
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Length, Mod
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0013_slug_c_collation"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(Length("content"), name="post_content_length_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(Length("content"), name="comment_content_length_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="tag",
+            index=models.Index(
+                F("color") / 65536 + Mod(F("color") / 256, 256) + Mod(F("color"), 256),
+                name="tag_rgb_sum_idx",
+            ),
+        ),
+    ]
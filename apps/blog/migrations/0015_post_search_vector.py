@@ -0,0 +1,63 @@
+# Generated by Django 4.2.25 on 2026-10-15 11:15
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+CREATE_TRIGGER = """
+CREATE FUNCTION blog_post_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.title, '')), 'A')
+        || setweight(to_tsvector('pg_catalog.english', coalesce(NEW.excerpt, '')), 'B')
+        || setweight(
+            to_tsvector('pg_catalog.english', array_to_string(NEW.tag_names, ' ')), 'B'
+        )
+        || setweight(to_tsvector('pg_catalog.simple', coalesce((
+            SELECT concat_ws(' ', username, first_name, last_name)
+            FROM users_user WHERE id = NEW.author_id
+        ), '')), 'C')
+        || setweight(to_tsvector('pg_catalog.english', coalesce((
+            SELECT name FROM blog_category WHERE id = NEW.category_id
+        ), '')), 'C')
+        || setweight(to_tsvector('pg_catalog.english', coalesce(NEW.content, '')), 'D');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER blog_post_search_vector
+    BEFORE INSERT OR UPDATE ON blog_post
+    FOR EACH ROW EXECUTE FUNCTION blog_post_search_vector_update();
+
+UPDATE blog_post SET id = id;
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS blog_post_search_vector ON blog_post;
+DROP FUNCTION IF EXISTS blog_post_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0014_content_length_and_rgb_sum_indexes"),
+        ("users", "0002_userprofile"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="post_search_vector_gin"
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
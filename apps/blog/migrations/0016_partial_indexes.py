@@ -0,0 +1,61 @@
+# Generated by Django 4.2.25 on 2026-10-15 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0015_post_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                condition=models.Q(("status", 1)),
+                fields=["-view_count"],
+                name="post_popular_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                condition=models.Q(("status", 1)),
+                fields=["-published_at"],
+                name="post_recent_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                condition=models.Q(("is_featured", True), ("status", 1)),
+                fields=["-published_at"],
+                name="post_featured_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                condition=models.Q(("is_approved", False), ("is_flagged", False)),
+                fields=["-created_at"],
+                name="comment_pending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                condition=models.Q(("is_flagged", True)),
+                fields=["-created_at"],
+                name="comment_flagged_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="subscriber",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["-subscribed_at"],
+                name="subscriber_active_idx",
+            ),
+        ),
+    ]
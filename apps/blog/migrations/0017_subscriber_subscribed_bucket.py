@@ -0,0 +1,41 @@
+# Generated by Django 4.2.25 on 2026-10-15 12:00
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+from django.utils import timezone
+
+
+def backfill_subscribed_bucket(apps, schema_editor):
+    Subscriber = apps.get_model("blog", "Subscriber")
+    now = timezone.now()
+    Subscriber.objects.update(
+        subscribed_bucket=Case(
+            When(subscribed_at__lt=now - timedelta(days=90), then=Value("loyal")),
+            When(subscribed_at__lt=now - timedelta(days=7), then=Value("regular")),
+            default=Value("new"),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0016_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="subscriber",
+            name="subscribed_bucket",
+            field=models.CharField(
+                choices=[("new", "New"), ("regular", "Regular"), ("loyal", "Loyal")],
+                db_index=True,
+                default="new",
+                editable=False,
+                max_length=8,
+            ),
+        ),
+        migrations.RunPython(backfill_subscribed_bucket, migrations.RunPython.noop),
+    ]
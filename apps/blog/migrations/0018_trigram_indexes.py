@@ -0,0 +1,30 @@
+# Generated by Django 4.2.25 on 2026-10-15 12:30
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0017_subscriber_subscribed_bucket"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="post",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["title"], name="post_title_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["content"],
+                name="comment_content_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
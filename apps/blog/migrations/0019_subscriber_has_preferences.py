@@ -0,0 +1,24 @@
+# Generated by Django 4.2.25 on 2026-10-15 12:45
+
+from django.db import migrations, models
+
+
+def backfill_has_preferences(apps, schema_editor):
+    Subscriber = apps.get_model("blog", "Subscriber")
+    Subscriber.objects.exclude(preferences={}).update(has_preferences=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0018_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="subscriber",
+            name="has_preferences",
+            field=models.BooleanField(db_index=True, default=False, editable=False),
+        ),
+        migrations.RunPython(backfill_has_preferences, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.25 on 2026-10-15 13:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_author_stats(apps, schema_editor):
+    AuthorStats = apps.get_model("blog", "AuthorStats")
+    Comment = apps.get_model("blog", "Comment")
+    counts = (
+        Comment.objects.order_by()
+        .values("author_id")
+        .annotate(total=models.Count("id"))
+        .values_list("author_id", "total")
+    )
+    AuthorStats.objects.bulk_create(
+        [
+            AuthorStats(user_id=author_id, comment_count=total)
+            for author_id, total in counts.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("blog", "0019_subscriber_has_preferences"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuthorStats",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="blog_stats",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "comment_count",
+                    models.PositiveIntegerField(db_index=True, default=0),
+                ),
+            ],
+        ),
+        migrations.RunPython(backfill_author_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.25 on 2026-10-15 13:30
+
+from django.db import migrations, models
+from django.db.models import Value
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0020_authorstats"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="blogsettings",
+            constraint=models.UniqueConstraint(
+                Value(True), name="blogsettings_singleton"
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.25 on 2026-10-15 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0021_blogsettings_singleton"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="post",
+            name="post_recent_idx",
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                condition=models.Q(("status", 1)),
+                fields=["-published_at", "-id"],
+                name="post_recent_idx",
+            ),
+        ),
+    ]
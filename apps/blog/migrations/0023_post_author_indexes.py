@@ -0,0 +1,19 @@
+# Generated by Django 4.2.25 on 2026-10-15 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0022_post_recent_idx_id"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["status", "author"], name="post_status_author_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 4.2.25 on 2026-10-15 14:40
+
+from django.db import migrations
+
+# Rebuild the vector only when a column it is built from is written, so the
+# view/comment-count UPDATEs no longer re-run the tsvector and its subqueries.
+# Author and category renames touch the posts' key columns to re-index them.
+CREATE_TRIGGERS = """
+DROP TRIGGER IF EXISTS blog_post_search_vector ON blog_post;
+CREATE TRIGGER blog_post_search_vector
+    BEFORE INSERT OR UPDATE OF title, excerpt, content, tag_names, author_id, category_id
+    ON blog_post
+    FOR EACH ROW EXECUTE FUNCTION blog_post_search_vector_update();
+
+CREATE FUNCTION blog_post_search_vector_author_renamed() RETURNS trigger AS $$
+BEGIN
+    UPDATE blog_post SET author_id = author_id WHERE author_id = NEW.id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER blog_post_search_vector_author
+    AFTER UPDATE OF username, first_name, last_name ON users_user
+    FOR EACH ROW
+    WHEN (
+        OLD.username IS DISTINCT FROM NEW.username
+        OR OLD.first_name IS DISTINCT FROM NEW.first_name
+        OR OLD.last_name IS DISTINCT FROM NEW.last_name
+    )
+    EXECUTE FUNCTION blog_post_search_vector_author_renamed();
+
+CREATE FUNCTION blog_post_search_vector_category_renamed() RETURNS trigger AS $$
+BEGIN
+    UPDATE blog_post SET category_id = category_id WHERE category_id = NEW.id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER blog_post_search_vector_category
+    AFTER UPDATE OF name ON blog_category
+    FOR EACH ROW
+    WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION blog_post_search_vector_category_renamed();
+
+-- Re-index posts whose author or category was renamed before this migration
+UPDATE blog_post SET title = title;
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER IF EXISTS blog_post_search_vector_category ON blog_category;
+DROP FUNCTION IF EXISTS blog_post_search_vector_category_renamed();
+DROP TRIGGER IF EXISTS blog_post_search_vector_author ON users_user;
+DROP FUNCTION IF EXISTS blog_post_search_vector_author_renamed();
+DROP TRIGGER IF EXISTS blog_post_search_vector ON blog_post;
+CREATE TRIGGER blog_post_search_vector
+    BEFORE INSERT OR UPDATE ON blog_post
+    FOR EACH ROW EXECUTE FUNCTION blog_post_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0023_post_author_indexes"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
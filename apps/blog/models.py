@@ -1,16 +1,20 @@
-
-from datetime import date, datetime, timedelta
-from math import perm
-from multiprocessing import managers
-from tabnanny import verbose
+from datetime import datetime, timedelta
 
 # Import GraphQL types for mutation output
 import graphene
 from django.conf import settings
+from django.contrib.postgres.expressions import ArraySubquery
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchVectorField
+from django.core.cache import cache
+from django.core.validators import MaxValueValidator
 from django.db import models
-from django.db.models import Count, Q
+from django.db.models import Case, Count, Exists, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Length, Mod
 from django.utils import timezone
 from graphene import Boolean, DateTime, Int, ObjectType, String
+from graphene.utils.str_converters import to_snake_case
 
 # Import GraphQLMeta for testing
 from rail_django_graphql.core.meta import GraphQLMeta
@@ -18,7 +22,14 @@ from rail_django_graphql.core.meta import GraphQLMeta
 # import business_logic
 from rail_django_graphql.decorators import business_logic, mutation
 
-from .managers import PublishedManager
+from .fields import FastJSONField
+from .managers import (
+    ActiveCachedManager,
+    CommentManager,
+    PublishedManager,
+    SubscriberManager,
+    invalidate_published_cache,
+)
 
 # Import security features
 from .security import BlogRoles, FieldAccessLevel, encrypt_sensitive_field, secure_model
@@ -26,6 +37,87 @@ from .security import BlogRoles, FieldAccessLevel, encrypt_sensitive_field, secu
 # from rail_django_graphql.core.decorators import mutation
 
 
+def _count_subquery(queryset, fk_field, outer="pk"):
+    """Correlated ``COUNT(*)`` of ``queryset`` rows pointing at the outer row.
+
+    Used instead of ``Count()`` over a join so that each count is an
+    independent index lookup rather than a JOIN + GROUP BY over the parent.
+    """
+    counts = (
+        queryset.filter(**{fk_field: OuterRef(outer)})
+        .order_by()
+        .values(fk_field)
+        .annotate(total=Count("*"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts, output_field=models.IntegerField()), 0)
+
+
+def _filter_by_related_count(queryset, child_queryset, fk_field, value):
+    """Keep rows of ``queryset`` that have exactly ``value`` children.
+
+    The grouping and ``HAVING`` run inside a subquery over the child table,
+    so the parent rows are matched with a semi-join instead of being joined
+    and grouped. Zero is an anti-join, as parents without children never
+    appear in the grouped subquery.
+    """
+    if not value:
+        return queryset.filter(
+            ~Exists(child_queryset.filter(**{fk_field: OuterRef("pk")}))
+        )
+    matching = (
+        child_queryset.order_by()
+        .values(fk_field)
+        .annotate(total=Count("*"))
+        .filter(total=value)
+        .values(fk_field)
+    )
+    return queryset.filter(pk__in=matching)
+
+
+# Sum of the R, G and B channels unpacked from Tag.color. Filters must use
+# this exact expression for the database to pick up the matching index.
+RGB_SUM = F("color") / 65536 + Mod(F("color") / 256, 256) + Mod(F("color"), 256)
+
+CONTENT_LENGTH = Length("content")
+
+
+def _days_ago(days):
+    """Return ``now - days`` truncated to the minute.
+
+    Rolling windows built from this share identical SQL parameters for a
+    whole minute, so their results can be served from SQL-keyed caches.
+    """
+    return timezone.now().replace(second=0, microsecond=0) - timedelta(days=days)
+
+
+def _selected_field_names(info):
+    """Model-style (snake_case) names of every field selected below the
+    field being resolved.
+
+    Fragments are followed. Returns ``None`` when ``info`` carries no
+    selection to inspect.
+    """
+    field_nodes = getattr(info, "field_nodes", None)
+    if not field_nodes:
+        return None
+    names = set()
+    pending = [node.selection_set for node in field_nodes]
+    while pending:
+        selection_set = pending.pop()
+        if selection_set is None:
+            continue
+        for selection in selection_set.selections:
+            if selection.kind == "fragment_spread":
+                pending.append(info.fragments[selection.name.value].selection_set)
+                continue
+            if selection.kind == "field":
+                # Schemas may auto-camelcase names (searchVector)
+                names.add(to_snake_case(selection.name.value))
+            pending.append(selection.selection_set)
+    return names
+
+
 # GraphQL Output Types for mutations
 class NotificationResult(ObjectType):
     """GraphQL type for notification result."""
@@ -64,12 +156,14 @@ class PublishPostResult(ObjectType):
 )
 class Category(models.Model):
     name = models.CharField(max_length=100, verbose_name="Nom du category")
-    slug = models.SlugField(unique=True)
+    slug = models.SlugField(unique=True, db_collation="C")
     description = models.TextField(blank=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ActiveCachedManager()
+
     class GraphQLMeta(GraphQLMeta):
         """GraphQL configuration for Category model."""
 
@@ -111,14 +205,16 @@ class Category(models.Model):
     # Custom resolver methods for GraphQLMeta
     @classmethod
     def get_active_categories(cls, queryset, info, **kwargs):
-        """Get only active categories."""
-        return queryset.filter(is_active=True)
+        """Get only active categories, resolved from the cached id list."""
+        return queryset.filter(pk__in=cls.objects.active_ids())
 
     @classmethod
     def get_popular_categories(cls, queryset, info, **kwargs):
         """Get categories with most posts."""
         return (
-            queryset.annotate(post_count=Count("posts"))
+            queryset.annotate(
+                post_count=_count_subquery(Post.objects.all(), "category")
+            )
             .filter(is_active=True, post_count__gt=0)
             .order_by("-post_count")
         )
@@ -127,14 +223,13 @@ class Category(models.Model):
     @classmethod
     def filter_has_posts(cls, queryset, name, value):
         """Filter categories that have or don't have posts."""
-        if value:
-            return queryset.filter(posts__isnull=False).distinct()
-        return queryset.filter(posts__isnull=True)
+        has_posts = Exists(Post.objects.filter(category_id=OuterRef("pk")))
+        return queryset.filter(has_posts if value else ~has_posts)
 
     @classmethod
     def filter_by_post_count(cls, queryset, name, value):
         """Filter by number of posts in category."""
-        return queryset.annotate(post_count=Count("posts")).filter(post_count=value)
+        return _filter_by_related_count(queryset, Post.objects.all(), "category", value)
 
 
 @secure_model(
@@ -148,11 +243,21 @@ class Category(models.Model):
 )
 class Tag(models.Model):
     name = models.CharField(max_length=50)
-    slug = models.SlugField(unique=True)
-    color = models.CharField(max_length=7, default="#000000")  # Hex color
+    slug = models.SlugField(unique=True, db_collation="C")
+    # RGB color packed as 0xRRGGBB; use color_hex for the "#rrggbb" form
+    color = models.PositiveIntegerField(
+        default=0, validators=[MaxValueValidator(0xFFFFFF)]
+    )
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ActiveCachedManager()
+
+    class Meta:
+        indexes = [
+            models.Index(RGB_SUM, name="tag_rgb_sum_idx"),
+        ]
+
     class GraphQLMeta(GraphQLMeta):
         """GraphQL configuration for Tag model."""
 
@@ -192,17 +297,28 @@ class Tag(models.Model):
     def __str__(self):
         return self.name
 
+    @property
+    def color_hex(self):
+        """Color as a ``#rrggbb`` string."""
+        return f"#{self.color:06x}"
+
+    @color_hex.setter
+    def color_hex(self, value):
+        self.color = int(value.lstrip("#"), 16)
+
     # Custom resolver methods for GraphQLMeta
     @classmethod
     def get_active_tags(cls, queryset, info, **kwargs):
-        """Get only active tags."""
-        return queryset.filter(is_active=True)
+        """Get only active tags, resolved from the cached id list."""
+        return queryset.filter(pk__in=cls.objects.active_ids())
 
     @classmethod
     def get_popular_tags(cls, queryset, info, **kwargs):
         """Get tags with most posts."""
         return (
-            queryset.annotate(post_count=Count("posts"))
+            queryset.annotate(
+                post_count=_count_subquery(Post.tags.through.objects.all(), "tag")
+            )
             .filter(is_active=True, post_count__gt=0)
             .order_by("-post_count")
         )
@@ -210,64 +326,54 @@ class Tag(models.Model):
     @classmethod
     def get_trending_tags(cls, queryset, info, **kwargs):
         """Get tags used in recent posts."""
-        thirty_days_ago = timezone.now() - timedelta(days=30)
+        thirty_days_ago = _days_ago(30)
+        recent_links = Post.tags.through.objects.filter(
+            post__published_at__gte=thirty_days_ago,
+            post__status=Post.Status.PUBLISHED,
+        )
         return (
-            queryset.filter(
-                posts__published_at__gte=thirty_days_ago,
-                posts__status="published",
-                is_active=True,
-            )
-            .annotate(recent_post_count=Count("posts"))
+            queryset.filter(is_active=True)
+            .annotate(recent_post_count=_count_subquery(recent_links, "tag"))
+            .filter(recent_post_count__gt=0)
             .order_by("-recent_post_count")
-            .distinct()
         )
 
     # Custom filter methods for GraphQLMeta
     @classmethod
     def filter_has_posts(cls, queryset, name, value):
         """Filter tags that have or don't have posts."""
-        if value:
-            return queryset.filter(posts__isnull=False).distinct()
-        return queryset.filter(posts__isnull=True)
+        has_posts = Exists(Post.tags.through.objects.filter(tag_id=OuterRef("pk")))
+        return queryset.filter(has_posts if value else ~has_posts)
 
     @classmethod
     def filter_by_post_count(cls, queryset, name, value):
         """Filter by number of posts with this tag."""
-        return queryset.annotate(post_count=Count("posts")).filter(post_count=value)
+        return _filter_by_related_count(
+            queryset, Post.tags.through.objects.all(), "tag", value
+        )
 
     @classmethod
     def filter_by_color_category(cls, queryset, name, value):
         """Filter by color category (light, dark, bright)."""
+        queryset = queryset.alias(rgb_sum=RGB_SUM)
         if value == "light":
             # Light colors have high RGB values
-            return queryset.extra(
-                where=[
-                    "CAST(CONV(SUBSTRING(color, 2, 2), 16, 10) AS UNSIGNED) + "
-                    "CAST(CONV(SUBSTRING(color, 4, 2), 16, 10) AS UNSIGNED) + "
-                    "CAST(CONV(SUBSTRING(color, 6, 2), 16, 10) AS UNSIGNED) > 600"
-                ]
-            )
+            return queryset.filter(rgb_sum__gt=600)
         elif value == "dark":
             # Dark colors have low RGB values
-            return queryset.extra(
-                where=[
-                    "CAST(CONV(SUBSTRING(color, 2, 2), 16, 10) AS UNSIGNED) + "
-                    "CAST(CONV(SUBSTRING(color, 4, 2), 16, 10) AS UNSIGNED) + "
-                    "CAST(CONV(SUBSTRING(color, 6, 2), 16, 10) AS UNSIGNED) < 200"
-                ]
-            )
+            return queryset.filter(rgb_sum__lt=200)
         elif value == "bright":
             # Bright colors have medium to high RGB values
-            return queryset.extra(
-                where=[
-                    "CAST(CONV(SUBSTRING(color, 2, 2), 16, 10) AS UNSIGNED) + "
-                    "CAST(CONV(SUBSTRING(color, 4, 2), 16, 10) AS UNSIGNED) + "
-                    "CAST(CONV(SUBSTRING(color, 6, 2), 16, 10) AS UNSIGNED) BETWEEN 200 AND 600"
-                ]
-            )
+            return queryset.filter(rgb_sum__range=(200, 600))
         return queryset
 
 
+class PostStatus(models.IntegerChoices):
+    DRAFT = 0, "Draft"
+    PUBLISHED = 1, "Published"
+    ARCHIVED = 2, "Archived"
+
+
 @secure_model(
     {
         "required_roles": [BlogRoles.AUTHOR, BlogRoles.EDITOR, BlogRoles.ADMIN],
@@ -276,10 +382,14 @@ class Tag(models.Model):
             "status": FieldAccessLevel.OWNER_OR_ADMIN,
             "is_featured": FieldAccessLevel.ADMIN_ONLY,
             "view_count": FieldAccessLevel.READ_ONLY,
+            "comment_count": FieldAccessLevel.READ_ONLY,
+            "tag_names": FieldAccessLevel.READ_ONLY,
         },
     }
 )
 class Post(models.Model):
+    Status = PostStatus
+
     author = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="posts"
     )
@@ -288,6 +398,7 @@ class Post(models.Model):
 
     slug = models.SlugField(
         unique=True,
+        db_collation="C",
         verbose_name="Slug",
     )
 
@@ -301,26 +412,63 @@ class Post(models.Model):
         verbose_name="Catégorie",
     )
     tags = models.ManyToManyField(Tag, blank=True, related_name="posts")
-    status = models.CharField(
-        max_length=20,
-        choices=[
-            ("draft", "Draft"),
-            ("published", "Published"),
-            ("archived", "Archived"),
-        ],
-        default="draft",
+    status = models.PositiveSmallIntegerField(
+        choices=Status.choices,
+        default=Status.DRAFT,
     )
     featured_image = models.URLField(blank=True)
     is_featured = models.BooleanField(default=False)
     view_count = models.PositiveIntegerField(default=0)
-    created_at = models.DateField(auto_now_add=True, verbose_name="Créer le")
+    # Denormalized from approved comments and tags (kept in sync by signals)
+    comment_count = models.PositiveIntegerField(
+        default=0, db_index=True, editable=False
+    )
+    tag_names = ArrayField(
+        models.CharField(max_length=50), blank=True, default=list, editable=False
+    )
+    # Maintained by the blog_post_search_vector triggers (migrations 0015 and
+    # 0024): rebuilt when an indexed column changes or the author or category
+    # is renamed
+    search_vector = SearchVectorField(null=True, editable=False)
+    created_at = models.DateTimeField(
+        auto_now_add=True, db_index=True, verbose_name="Créer le"
+    )
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(null=True, blank=True)
     objects = models.Manager()
     published = PublishedManager()
 
     class Meta:
-        ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["status", "-created_at"], name="post_status_created_idx"
+            ),
+            models.Index(fields=["-published_at"], name="post_published_at_idx"),
+            models.Index(
+                fields=["-view_count"],
+                name="post_popular_idx",
+                condition=Q(status=PostStatus.PUBLISHED),
+            ),
+            models.Index(
+                fields=["-published_at", "-id"],
+                name="post_recent_idx",
+                condition=Q(status=PostStatus.PUBLISHED),
+            ),
+            models.Index(
+                fields=["-published_at"],
+                name="post_featured_idx",
+                condition=Q(status=PostStatus.PUBLISHED, is_featured=True),
+            ),
+            # Author-scoped visibility: own posts of any status, or published
+            models.Index(fields=["status", "author"], name="post_status_author_idx"),
+            models.Index(CONTENT_LENGTH, name="post_content_length_idx"),
+            GinIndex(fields=["search_vector"], name="post_search_vector_gin"),
+            # Lets the title__icontains filter's ILIKE '%q%' use an index; body
+            # text is searched through post_search_vector_gin instead
+            GinIndex(
+                fields=["title"], name="post_title_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ]
 
     @mutation(description="Publish a blog post with validation and status updates")
     def publish_post(
@@ -361,7 +509,7 @@ class Post(models.Model):
             if not self.category:
                 raise ValueError("Post must have a category assigned")
 
-            if self.status == "archived":
+            if self.status == self.Status.ARCHIVED:
                 raise ValueError("Cannot publish archived posts")
 
             # Handle publish date
@@ -380,10 +528,10 @@ class Post(models.Model):
 
             # Update post status and metadata
             previous_status = self.status
-            self.status = "published"
+            self.status = self.Status.PUBLISHED
 
             # Increment view count for newly published posts
-            if previous_status != "published":
+            if previous_status != self.Status.PUBLISHED:
                 self.view_count = 0
 
             # Save the post
@@ -391,7 +539,7 @@ class Post(models.Model):
 
             # Business logic for subscriber notification
             notification_result = None
-            if notify_subscribers and previous_status != "published":
+            if notify_subscribers and previous_status != self.Status.PUBLISHED:
                 try:
                     # Simulate notification logic
                     from .models import Subscriber
@@ -414,8 +562,8 @@ class Post(models.Model):
                     "message": f"Post '{self.title}' published successfully",
                     "post_id": self.id,
                     "published_at": self.published_at.isoformat(),
-                    "previous_status": previous_status,
-                    "current_status": self.status,
+                    "previous_status": self.Status(previous_status).name.lower(),
+                    "current_status": self.Status(self.status).name.lower(),
                     "notification_result": notification_result,
                     "view_count": self.view_count,
                 }
@@ -443,17 +591,9 @@ class Post(models.Model):
     class GraphQLMeta(GraphQLMeta):
         """GraphQL configuration for Post model - Enhanced with comprehensive features."""
 
-        # Quick filter configuration - search across multiple fields
-        quick_filter_fields = [
-            "title",
-            "content",
-            "excerpt",
-            "author__username",
-            "author__first_name",
-            "author__last_name",
-            "category__name",
-            "tags__name",
-        ]
+        # The quick filter is a full-text match on search_vector (see
+        # filter_by_search), which covers title, content, excerpt, tags,
+        # author and category names with one GIN lookup.
 
         # Custom resolvers for specialized queries
         custom_resolvers = {
@@ -474,6 +614,7 @@ class Post(models.Model):
             "published_this_year": "filter_published_this_year",
             "engagement_level": "filter_by_engagement_level",
             "reading_time": "filter_by_reading_time",
+            "quick": "filter_by_search",
         }
 
         # Standard filter fields
@@ -488,7 +629,6 @@ class Post(models.Model):
             "category": ["exact", "in"],
             "tags": ["exact", "in"],
             "view_count": ["exact", "gt", "gte", "lt", "lte", "range"],
-            "quick": ["icontains"],  # Enable quick filter
         }
 
         # Ordering fields
@@ -503,50 +643,160 @@ class Post(models.Model):
     def __str__(self):
         return self.title
 
+    VIEW_COUNTS_HASH = "blog:post:views"
+
+    @staticmethod
+    def _redis_client():
+        """Return the raw Redis client behind the default cache, if any."""
+        try:
+            from django_redis import get_redis_connection
+        except ImportError:
+            return None
+        try:
+            return get_redis_connection("default")
+        except NotImplementedError:
+            return None
+
+    @classmethod
+    def increment_views(cls, pk):
+        """Buffer a page view in Redis instead of writing to the database.
+
+        Views accumulate in a single hash via HINCRBY. Other cache backends
+        have no atomic shared counter to buffer in, so the view is written
+        through with one ``UPDATE ... SET view_count = view_count + 1``.
+        """
+        client = cls._redis_client()
+        if client is not None:
+            client.hincrby(cls.VIEW_COUNTS_HASH, pk, 1)
+            return
+        cls.objects.filter(pk=pk).update(view_count=F("view_count") + 1)
+
+    @classmethod
+    def _pop_view_deltas(cls):
+        client = cls._redis_client()
+        if client is None:
+            return {}
+        # HGETALL and DEL run in one MULTI/EXEC so no view is lost.
+        pipe = client.pipeline()
+        pipe.hgetall(cls.VIEW_COUNTS_HASH)
+        pipe.delete(cls.VIEW_COUNTS_HASH)
+        buffered, _ = pipe.execute()
+        return {int(pk): int(delta) for pk, delta in buffered.items()}
+
+    @classmethod
+    def flush_view_counts(cls):
+        """Apply buffered page views to the database in a single UPDATE.
+
+        Returns the number of posts that were updated.
+        """
+        deltas = cls._pop_view_deltas()
+        if not deltas:
+            return 0
+        cls.objects.filter(pk__in=deltas).update(
+            view_count=F("view_count")
+            + Case(
+                *(When(pk=pk, then=Value(delta)) for pk, delta in deltas.items()),
+                default=Value(0),
+                output_field=models.PositiveIntegerField(),
+            )
+        )
+        invalidate_published_cache()
+        return len(deltas)
+
+    @classmethod
+    def refresh_comment_count(cls, post_ids):
+        """Recompute the denormalized approved comment count in one UPDATE."""
+        cls.objects.filter(pk__in=post_ids).update(
+            comment_count=_count_subquery(
+                Comment.objects.filter(is_approved=True), "post"
+            )
+        )
+
+    @classmethod
+    def refresh_tag_names(cls, post_ids):
+        """Recompute the denormalized tag name list in one UPDATE."""
+        cls.objects.filter(pk__in=post_ids).update(
+            tag_names=ArraySubquery(
+                cls.tags.through.objects.filter(post_id=OuterRef("pk"))
+                .order_by("tag__name")
+                .values("tag__name")
+            )
+        )
+
     @mutation(description="Publish a blog post with validation and status updates")
-    def test_prop(self) -> date:
+    def test_prop(self) -> datetime:
         return self.created_at
 
+    # Wide columns skipped by list resolvers unless the query selects them
+    DEFERRABLE_FIELDS = ("content", "search_vector")
+
+    @classmethod
+    def _with_relations(cls, queryset, info=None):
+        """Load author and category in the same query and tags in one more.
+
+        With ``info``, wide columns the GraphQL query does not select are
+        deferred.
+        """
+        queryset = queryset.select_related("author", "category").prefetch_related(
+            "tags"
+        )
+        requested = _selected_field_names(info)
+        if requested is not None:
+            skipped = [name for name in cls.DEFERRABLE_FIELDS if name not in requested]
+            if skipped:
+                queryset = queryset.defer(*skipped)
+        return queryset
+
     # Custom resolver methods for GraphQLMeta
     @classmethod
     def get_published_posts(cls, queryset, info, **kwargs):
         """Get only published posts."""
-        return queryset.filter(status="published")
+        return cls._with_relations(queryset.filter(status=cls.Status.PUBLISHED), info)
 
     @classmethod
     def get_featured_posts(cls, queryset, info, **kwargs):
         """Get featured posts that are published."""
-        return queryset.filter(is_featured=True, status="published")
+        return cls._with_relations(
+            queryset.filter(is_featured=True, status=cls.Status.PUBLISHED), info
+        )
 
     @classmethod
     def get_popular_posts(cls, queryset, info, **kwargs):
         """Get posts with high view count."""
-        return queryset.filter(status="published", view_count__gte=100).order_by(
-            "-view_count"
-        )
+        return cls._with_relations(
+            queryset.filter(status=cls.Status.PUBLISHED, view_count__gte=100), info
+        ).order_by("-view_count")
 
     @classmethod
     def get_recent_posts(cls, queryset, info, days=7, **kwargs):
         """Get posts from the last N days."""
-        cutoff_date = timezone.now() - timedelta(days=days)
-        return queryset.filter(
-            status="published", published_at__gte=cutoff_date
+        cutoff_date = _days_ago(days)
+        return cls._with_relations(
+            queryset.filter(status=cls.Status.PUBLISHED, published_at__gte=cutoff_date),
+            info,
         ).order_by("-published_at")
 
     @classmethod
     def get_posts_by_author(cls, queryset, info, author_id=None, **kwargs):
         """Get posts by specific author."""
+        queryset = cls._with_relations(
+            queryset.filter(status=cls.Status.PUBLISHED), info
+        )
         if author_id:
-            return queryset.filter(author_id=author_id, status="published")
-        return queryset.filter(status="published")
+            return queryset.filter(author_id=author_id)
+        return queryset
 
     @classmethod
     def get_trending_posts(cls, queryset, info, **kwargs):
         """Get trending posts based on recent views and comments."""
-        seven_days_ago = timezone.now() - timedelta(days=7)
+        seven_days_ago = _days_ago(7)
         return (
-            queryset.filter(status="published", published_at__gte=seven_days_ago)
-            .annotate(comment_count=Count("comments"))
+            cls._with_relations(
+                queryset.filter(
+                    status=cls.Status.PUBLISHED, published_at__gte=seven_days_ago
+                ),
+                info,
+            )
             .filter(Q(view_count__gte=50) | Q(comment_count__gte=5))
             .order_by("-view_count", "-comment_count")
         )
@@ -554,45 +804,52 @@ class Post(models.Model):
     @classmethod
     def get_draft_posts(cls, queryset, info, **kwargs):
         """Get draft posts (requires appropriate permissions)."""
-        return queryset.filter(status="draft")
+        return cls._with_relations(queryset.filter(status=cls.Status.DRAFT), info)
 
     # Custom filter methods for GraphQLMeta
     @classmethod
     def filter_has_comments(cls, queryset, name, value):
         """Filter posts that have or don't have comments."""
-        if value:
-            return queryset.filter(comments__isnull=False).distinct()
-        return queryset.filter(comments__isnull=True)
+        has_comments = Exists(Comment.objects.filter(post_id=OuterRef("pk")))
+        return queryset.filter(has_comments if value else ~has_comments)
 
     @classmethod
     def filter_by_content_length(cls, queryset, name, value):
         """Filter by content length (short, medium, long)."""
+        queryset = queryset.alias(content_length=CONTENT_LENGTH)
         if value == "short":
-            return queryset.extra(where=["LENGTH(content) < 500"])
+            return queryset.filter(content_length__lt=500)
         elif value == "medium":
-            return queryset.extra(where=["LENGTH(content) BETWEEN 500 AND 2000"])
+            return queryset.filter(content_length__range=(500, 2000))
         elif value == "long":
-            return queryset.extra(where=["LENGTH(content) > 2000"])
+            return queryset.filter(content_length__gt=2000)
         return queryset
 
     @classmethod
     def filter_by_tag_count(cls, queryset, name, value):
         """Filter by number of tags."""
-        return queryset.annotate(tag_count=Count("tags")).filter(tag_count=value)
+        return _filter_by_related_count(
+            queryset, Post.tags.through.objects.all(), "post", value
+        )
 
     @classmethod
     def filter_published_this_year(cls, queryset, name, value):
         """Filter posts published this year."""
         if value:
-            current_year = timezone.now().year
-            return queryset.filter(published_at__year=current_year, status="published")
+            start = timezone.localtime().replace(
+                month=1, day=1, hour=0, minute=0, second=0, microsecond=0
+            )
+            end = start.replace(year=start.year + 1)
+            return queryset.filter(
+                published_at__gte=start,
+                published_at__lt=end,
+                status=cls.Status.PUBLISHED,
+            )
         return queryset
 
     @classmethod
     def filter_by_engagement_level(cls, queryset, name, value):
         """Filter by engagement level (high, medium, low)."""
-        queryset = queryset.annotate(comment_count=Count("comments"))
-
         if value == "high":
             return queryset.filter(Q(view_count__gte=200) | Q(comment_count__gte=10))
         elif value == "medium":
@@ -603,20 +860,28 @@ class Post(models.Model):
             return queryset.filter(view_count__lt=50, comment_count__lt=3)
         return queryset
 
+    @classmethod
+    def filter_by_search(cls, queryset, name, value):
+        """Full-text search over title, excerpt, content, tags, author and category."""
+        if not value:
+            return queryset
+        return queryset.filter(search_vector=SearchQuery(value, config="english"))
+
     @classmethod
     def filter_by_reading_time(cls, queryset, name, value):
         """Filter by estimated reading time (quick, medium, long)."""
         # Assuming average reading speed of 200 words per minute
         # and roughly 5 characters per word
+        queryset = queryset.alias(content_length=CONTENT_LENGTH)
         if value == "quick":
             # Less than 3 minutes (600 words, ~3000 characters)
-            return queryset.extra(where=["LENGTH(content) < 3000"])
+            return queryset.filter(content_length__lt=3000)
         elif value == "medium":
             # 3-10 minutes (600-2000 words, ~3000-10000 characters)
-            return queryset.extra(where=["LENGTH(content) BETWEEN 3000 AND 10000"])
+            return queryset.filter(content_length__range=(3000, 10000))
         elif value == "long":
             # More than 10 minutes (2000+ words, ~10000+ characters)
-            return queryset.extra(where=["LENGTH(content) > 10000"])
+            return queryset.filter(content_length__gt=10000)
         return queryset
 
     # test_prop.fget.short_description = ""
@@ -653,8 +918,31 @@ class Comment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CommentManager()
+
     class Meta:
-        ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["post", "is_approved", "-created_at"],
+                name="comment_post_approved_idx",
+            ),
+            models.Index(
+                fields=["-created_at"],
+                name="comment_pending_idx",
+                condition=Q(is_approved=False, is_flagged=False),
+            ),
+            models.Index(
+                fields=["-created_at"],
+                name="comment_flagged_idx",
+                condition=Q(is_flagged=True),
+            ),
+            models.Index(CONTENT_LENGTH, name="comment_content_length_idx"),
+            GinIndex(
+                fields=["content"],
+                name="comment_content_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
 
     class GraphQLMeta(GraphQLMeta):
         """GraphQL configuration for Comment model."""
@@ -704,57 +992,62 @@ class Comment(models.Model):
     def __str__(self):
         return f"Comment by {self.author.username} on {self.post.title}"
 
+    @staticmethod
+    def _with_relations(queryset):
+        """Load author, post and parent comment in the same query."""
+        return queryset.select_related("author", "post", "parent")
+
     # Custom resolver methods for GraphQLMeta
     @classmethod
     def get_approved_comments(cls, queryset, info, **kwargs):
         """Get only approved comments."""
-        return queryset.filter(is_approved=True, is_flagged=False)
+        return cls._with_relations(queryset.filter(is_approved=True, is_flagged=False))
 
     @classmethod
     def get_pending_comments(cls, queryset, info, **kwargs):
         """Get comments pending approval."""
-        return queryset.filter(is_approved=False, is_flagged=False)
+        return cls._with_relations(queryset.filter(is_approved=False, is_flagged=False))
 
     @classmethod
     def get_flagged_comments(cls, queryset, info, **kwargs):
         """Get flagged comments (admin only)."""
-        return queryset.filter(is_flagged=True)
+        return cls._with_relations(queryset.filter(is_flagged=True))
 
     @classmethod
     def get_recent_comments(cls, queryset, info, days=7, **kwargs):
         """Get comments from the last N days."""
-        cutoff_date = timezone.now() - timedelta(days=days)
-        return queryset.filter(created_at__gte=cutoff_date, is_approved=True).order_by(
-            "-created_at"
-        )
+        cutoff_date = _days_ago(days)
+        return cls._with_relations(
+            queryset.filter(created_at__gte=cutoff_date, is_approved=True)
+        ).order_by("-created_at")
 
     @classmethod
     def get_top_level_comments(cls, queryset, info, **kwargs):
         """Get top-level comments (not replies)."""
-        return queryset.filter(parent__isnull=True)
+        return queryset.filter(parent__isnull=True).select_related("author", "post")
 
     @classmethod
     def get_replies(cls, queryset, info, **kwargs):
         """Get reply comments."""
-        return queryset.filter(parent__isnull=False)
+        return cls._with_relations(queryset.filter(parent__isnull=False))
 
     # Custom filter methods for GraphQLMeta
     @classmethod
     def filter_has_replies(cls, queryset, name, value):
         """Filter comments that have or don't have replies."""
-        if value:
-            return queryset.filter(replies__isnull=False).distinct()
-        return queryset.filter(replies__isnull=True)
+        has_replies = Exists(Comment.objects.filter(parent_id=OuterRef("pk")))
+        return queryset.filter(has_replies if value else ~has_replies)
 
     @classmethod
     def filter_by_content_length(cls, queryset, name, value):
         """Filter by content length (short, medium, long)."""
+        queryset = queryset.alias(content_length=CONTENT_LENGTH)
         if value == "short":
-            return queryset.extra(where=["LENGTH(content) < 100"])
+            return queryset.filter(content_length__lt=100)
         elif value == "medium":
-            return queryset.extra(where=["LENGTH(content) BETWEEN 100 AND 500"])
+            return queryset.filter(content_length__range=(100, 500))
         elif value == "long":
-            return queryset.extra(where=["LENGTH(content) > 500"])
+            return queryset.filter(content_length__gt=500)
         return queryset
 
     @classmethod
@@ -762,17 +1055,38 @@ class Comment(models.Model):
         """Filter by author's comment activity level."""
         if value == "active":
             # Authors with 5+ comments
-            return queryset.annotate(
-                author_comment_count=Count("author__comments")
-            ).filter(author_comment_count__gte=5)
+            return queryset.filter(author__blog_stats__comment_count__gte=5)
         elif value == "new":
-            # Authors with 1-2 comments
-            return queryset.annotate(
-                author_comment_count=Count("author__comments")
-            ).filter(author_comment_count__lte=2)
+            # Authors with 1-2 comments; no stats row means none counted yet
+            return queryset.filter(
+                Q(author__blog_stats__comment_count__lte=2)
+                | Q(author__blog_stats__isnull=True)
+            )
         return queryset
 
 
+class AuthorStats(models.Model):
+    """Denormalized per-user blog counters, kept in sync by signals."""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="blog_stats",
+    )
+    comment_count = models.PositiveIntegerField(default=0, db_index=True)
+
+    def __str__(self):
+        return f"Stats for {self.user}"
+
+    @classmethod
+    def refresh_comment_count(cls, user_ids):
+        """Recompute the comment count of the given users in one UPDATE."""
+        cls.objects.filter(pk__in=user_ids).update(
+            comment_count=_count_subquery(Comment.objects.all(), "author")
+        )
+
+
 @secure_model(
     {
         "sensitive_fields": ["email"],
@@ -781,18 +1095,47 @@ class Comment(models.Model):
         "field_permissions": {
             "email": FieldAccessLevel.ADMIN_ONLY,
             "preferences": FieldAccessLevel.OWNER_OR_ADMIN,
+            "subscribed_bucket": FieldAccessLevel.READ_ONLY,
+            "has_preferences": FieldAccessLevel.READ_ONLY,
         },
     }
 )
 class Subscriber(models.Model):
     """Newsletter subscribers with encrypted email."""
 
+    class Bucket(models.TextChoices):
+        NEW = "new", "New"
+        REGULAR = "regular", "Regular"
+        LOYAL = "loyal", "Loyal"
+
     email = models.EmailField(unique=True)
     name = models.CharField(max_length=100, blank=True)
     is_active = models.BooleanField(default=True)
     subscribed_at = models.DateTimeField(auto_now_add=True)
     unsubscribed_at = models.DateTimeField(null=True, blank=True)
-    preferences = models.JSONField(default=dict, blank=True)
+    preferences = FastJSONField(default=dict, blank=True)
+    # Mirrors bool(preferences) so the filter can skip reading the JSON blobs
+    has_preferences = models.BooleanField(default=False, db_index=True, editable=False)
+    # Tenure bucket, recomputed daily by the refresh_subscriber_buckets command
+    subscribed_bucket = models.CharField(
+        max_length=8,
+        choices=Bucket.choices,
+        default=Bucket.NEW,
+        db_index=True,
+        editable=False,
+    )
+
+    objects = SubscriberManager()
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["preferences"], name="subscriber_preferences_gin"),
+            models.Index(
+                fields=["-subscribed_at"],
+                name="subscriber_active_idx",
+                condition=Q(is_active=True),
+            ),
+        ]
 
     class GraphQLMeta(GraphQLMeta):
         """GraphQL configuration for Subscriber model."""
@@ -831,6 +1174,24 @@ class Subscriber(models.Model):
     def __str__(self):
         return f"Subscriber: {self.email}"
 
+    def save(self, *args, **kwargs):
+        self.has_preferences = bool(self.preferences)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "preferences" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "has_preferences"}
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def refresh_subscribed_buckets(cls):
+        """Recompute tenure buckets in one UPDATE; loyal rows never change."""
+        return cls.objects.exclude(subscribed_bucket=cls.Bucket.LOYAL).update(
+            subscribed_bucket=Case(
+                When(subscribed_at__lt=_days_ago(90), then=Value(cls.Bucket.LOYAL)),
+                When(subscribed_at__lt=_days_ago(7), then=Value(cls.Bucket.REGULAR)),
+                default=Value(cls.Bucket.NEW),
+            )
+        )
+
     # Custom resolver methods for GraphQLMeta
     @classmethod
     def get_active_subscribers(cls, queryset, info, **kwargs):
@@ -840,7 +1201,7 @@ class Subscriber(models.Model):
     @classmethod
     def get_recent_subscribers(cls, queryset, info, days=30, **kwargs):
         """Get subscribers from the last N days."""
-        cutoff_date = timezone.now() - timedelta(days=days)
+        cutoff_date = _days_ago(days)
         return queryset.filter(subscribed_at__gte=cutoff_date, is_active=True).order_by(
             "-subscribed_at"
         )
@@ -853,30 +1214,15 @@ class Subscriber(models.Model):
     # Custom filter methods for GraphQLMeta
     @classmethod
     def filter_by_subscription_duration(cls, queryset, name, value):
-        """Filter by how long they've been subscribed."""
-        now = timezone.now()
-
-        if value == "new":
-            # Subscribed within last 7 days
-            cutoff = now - timedelta(days=7)
-            return queryset.filter(subscribed_at__gte=cutoff)
-        elif value == "regular":
-            # Subscribed 7-90 days ago
-            start = now - timedelta(days=90)
-            end = now - timedelta(days=7)
-            return queryset.filter(subscribed_at__range=(start, end))
-        elif value == "loyal":
-            # Subscribed more than 90 days ago
-            cutoff = now - timedelta(days=90)
-            return queryset.filter(subscribed_at__lt=cutoff)
+        """Filter by how long they've been subscribed (new, regular, loyal)."""
+        if value in cls.Bucket.values:
+            return queryset.filter(subscribed_bucket=value)
         return queryset
 
     @classmethod
     def filter_has_preferences(cls, queryset, name, value):
         """Filter subscribers with or without preferences."""
-        if value:
-            return queryset.exclude(preferences={})
-        return queryset.filter(preferences={})
+        return queryset.filter(has_preferences=bool(value))
 
 
 @secure_model(
@@ -901,6 +1247,33 @@ class BlogSettings(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    CACHE_KEY = "blog_settings"
+    CACHE_TIMEOUT = 3600
+
+    PUBLIC_FIELDS = (
+        "site_title",
+        "site_description",
+        "posts_per_page",
+        "allow_comments",
+        "moderate_comments",
+    )
+    COMMENT_FIELDS = ("allow_comments", "moderate_comments")
+    DEFAULTS = Q(
+        site_title="My Blog",
+        posts_per_page=10,
+        allow_comments=True,
+        moderate_comments=True,
+        maintenance_mode=False,
+    )
+
+    class Meta:
+        verbose_name = "Blog Settings"
+        verbose_name_plural = "Blog Settings"
+        constraints = [
+            # A unique index on a constant admits exactly one row
+            models.UniqueConstraint(Value(True), name="blogsettings_singleton"),
+        ]
+
     class GraphQLMeta(GraphQLMeta):
         """GraphQL configuration for BlogSettings model."""
 
@@ -938,25 +1311,25 @@ class BlogSettings(models.Model):
         # Ordering fields
         ordering_fields = ["site_title", "created_at", "updated_at", "posts_per_page"]
 
-    class Meta:
-        verbose_name = "Blog Settings"
-        verbose_name_plural = "Blog Settings"
-
     def __str__(self):
         return f"Blog Settings: {self.site_title}"
 
+    @classmethod
+    def _cached_values(cls, queryset, fields):
+        """Serve unfiltered reads of the singleton from the cached row."""
+        if queryset.query.where:
+            return queryset.values(*fields)
+        obj = cls.load()
+        if obj.pk is None:
+            return []
+        return [{field: getattr(obj, field) for field in fields}]
+
     # Custom resolver methods for GraphQLMeta
     @classmethod
     def get_public_settings(cls, queryset, info, **kwargs):
         """Get settings that are safe to expose publicly."""
         # Return settings excluding sensitive fields
-        return queryset.values(
-            "site_title",
-            "site_description",
-            "posts_per_page",
-            "allow_comments",
-            "moderate_comments",
-        )
+        return cls._cached_values(queryset, cls.PUBLIC_FIELDS)
 
     @classmethod
     def get_admin_settings(cls, queryset, info, **kwargs):
@@ -967,7 +1340,7 @@ class BlogSettings(models.Model):
     @classmethod
     def get_comment_settings(cls, queryset, info, **kwargs):
         """Get comment-related settings."""
-        return queryset.values("allow_comments", "moderate_comments")
+        return cls._cached_values(queryset, cls.COMMENT_FIELDS)
 
     # Custom filter methods for GraphQLMeta
     @classmethod
@@ -992,23 +1365,27 @@ class BlogSettings(models.Model):
     def filter_is_default(cls, queryset, name, value):
         """Filter settings that have default values."""
         if value:
-            return queryset.filter(
-                site_title="My Blog",
-                posts_per_page=10,
-                allow_comments=True,
-                moderate_comments=True,
-                maintenance_mode=False,
-            )
-        return queryset.exclude(
-            site_title="My Blog",
-            posts_per_page=10,
-            allow_comments=True,
-            moderate_comments=True,
-            maintenance_mode=False,
-        )
+            return queryset.filter(cls.DEFAULTS)
+        return queryset.exclude(cls.DEFAULTS)
+
+    @classmethod
+    def load(cls):
+        """Return the settings singleton, served from cache when possible."""
+        obj = cache.get(cls.CACHE_KEY)
+        if obj is None:
+            obj = cls.objects.first() or cls()
+            cache.set(cls.CACHE_KEY, obj, cls.CACHE_TIMEOUT)
+        return obj
 
     def save(self, *args, **kwargs):
-        # Ensure only one settings instance exists
+        # Ensure only one settings instance exists; the blogsettings_singleton
+        # constraint backs this check up against concurrent creates
         if not self.pk and BlogSettings.objects.exists():
             raise ValueError("Only one BlogSettings instance is allowed")
         super().save(*args, **kwargs)
+        cache.delete(self.CACHE_KEY)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        cache.delete(self.CACHE_KEY)
+        return result
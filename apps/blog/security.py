@@ -4,9 +4,11 @@ Provides decorators and utilities for securing GraphQL operations."""
 import hashlib
 import json
 import logging
+import re
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
 
 from django.contrib.auth.models import AnonymousUser
 from django.core.exceptions import PermissionDenied
@@ -14,6 +16,21 @@ from django.core.exceptions import PermissionDenied
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Common injection patterns rejected by _validate_input_data
+DANGEROUS_PATTERNS = (
+    "<script",
+    "javascript:",
+    "onload=",
+    "onerror=",
+    "DROP TABLE",
+    "DELETE FROM",
+)
+# One case-insensitive pass over each value instead of one scan per pattern
+_DANGEROUS_RE = re.compile("|".join(map(re.escape, DANGEROUS_PATTERNS)), re.IGNORECASE)
+_DANGEROUS_BY_MATCH = {pattern.lower(): pattern for pattern in DANGEROUS_PATTERNS}
+# Opening or closing script tags in any case, with or without attributes
+_SCRIPT_TAG_RE = re.compile(r"</?script\b[^>]*>", re.IGNORECASE)
+
 
 class FieldAccessLevel(Enum):
     """Field access levels for GraphQL security."""
@@ -35,6 +52,63 @@ class BlogRoles(Enum):
     MODERATOR = "MODERATOR"
 
 
+def _role_values(roles: Iterable[Any]) -> FrozenSet[str]:
+    """Normalize roles (enum members or plain strings) to a frozenset of names."""
+    return frozenset(getattr(role, "value", role) for role in roles)
+
+
+def _user_roles(user) -> FrozenSet[str]:
+    """Return the user's role names, preferring the cached ``roles_set``."""
+    roles = getattr(user, "roles_set", None)
+    if isinstance(roles, frozenset):
+        return roles
+    return _role_values(getattr(user, "roles", ()))
+
+
+def _public_access(obj, user, operation: str) -> bool:
+    return True
+
+
+def _authenticated_access(obj, user, operation: str) -> bool:
+    return not isinstance(user, AnonymousUser)
+
+
+def _owner_or_admin_access(obj, user, operation: str) -> bool:
+    # Compare keys so checking ownership never loads the author row
+    owner_id = getattr(obj, "author_id", None)
+    return (user.pk is not None and owner_id == user.pk) or user.is_staff
+
+
+def _admin_only_access(obj, user, operation: str) -> bool:
+    return user.is_staff or user.is_superuser
+
+
+def _read_only_access(obj, user, operation: str) -> bool:
+    return operation == "read"
+
+
+# Access check for each level, looked up instead of walking an elif chain
+_FIELD_ACCESS_CHECKS = {
+    FieldAccessLevel.PUBLIC: _public_access,
+    FieldAccessLevel.AUTHENTICATED: _authenticated_access,
+    FieldAccessLevel.OWNER_OR_ADMIN: _owner_or_admin_access,
+    FieldAccessLevel.ADMIN_ONLY: _admin_only_access,
+    FieldAccessLevel.READ_ONLY: _read_only_access,
+}
+
+
+def _context_roles(context, user) -> FrozenSet[str]:
+    """Return the user's roles, normalized once per request on the context."""
+    roles = getattr(context, "_roles_cache", None)
+    if not isinstance(roles, frozenset):
+        roles = _user_roles(user)
+        try:
+            context._roles_cache = roles
+        except AttributeError:
+            pass
+    return roles
+
+
 # Security decorator for models
 def secure_model(security_config: Dict[str, Any]):
     """
@@ -55,37 +129,43 @@ def secure_model(security_config: Dict[str, Any]):
         # Store security configuration on the model
         model_class._graphql_security = security_config
 
+        # Resolve the configuration once, when the class is decorated
+        model_class._secure_meta = MappingProxyType(
+            {
+                "roles": _role_values(security_config.get("required_roles", [])),
+                "field_permissions": MappingProxyType(
+                    dict(security_config.get("field_permissions", {}))
+                ),
+                "audit_operations": frozenset(
+                    security_config.get("audit_operations", [])
+                ),
+                "sensitive_fields": frozenset(
+                    security_config.get("sensitive_fields", [])
+                ),
+            }
+        )
+
         # Add security validation methods
         def check_field_access(
             self, field_name: str, user, operation: str = "read"
         ) -> bool:
             """Check if user has access to a specific field."""
-            if not hasattr(self.__class__, "_graphql_security"):
-                return True
-
-            field_permissions = self.__class__._graphql_security.get(
-                "field_permissions", {}
+            access_level = self._secure_meta["field_permissions"].get(
+                field_name, FieldAccessLevel.PUBLIC
             )
-            access_level = field_permissions.get(field_name, FieldAccessLevel.PUBLIC)
+            check = _FIELD_ACCESS_CHECKS.get(access_level)
+            return check is not None and check(self, user, operation)
 
-            if access_level == FieldAccessLevel.PUBLIC:
-                return True
-            elif access_level == FieldAccessLevel.AUTHENTICATED:
-                return not isinstance(user, AnonymousUser)
-            elif access_level == FieldAccessLevel.OWNER_OR_ADMIN:
-                return (
-                    hasattr(self, "author") and self.author == user
-                ) or user.is_staff
-            elif access_level == FieldAccessLevel.ADMIN_ONLY:
-                return user.is_staff or user.is_superuser
-            elif access_level == FieldAccessLevel.READ_ONLY:
-                return operation == "read"
-
-            return False
-
-        def check_role_access(self, user, required_roles: List[str]) -> bool:
-            """Check if user has required roles."""
-            if not required_roles:
+        def check_role_access(
+            self, user, required_roles: Optional[List[str]] = None
+        ) -> bool:
+            """Check if user has required roles (defaults to the model's roles)."""
+            if required_roles is None:
+                roles = self._secure_meta["roles"]
+            else:
+                roles = _role_values(required_roles)
+
+            if not roles:
                 return True
 
             if isinstance(user, AnonymousUser):
@@ -96,8 +176,7 @@ def secure_model(security_config: Dict[str, Any]):
                 return True
 
             # Check user roles (simplified - in real app, use proper RBAC)
-            user_roles = getattr(user, "roles", [])
-            return any(role in required_roles for role in user_roles)
+            return not roles.isdisjoint(_user_roles(user))
 
         # Add methods to model class
         model_class.check_field_access = check_field_access
@@ -125,28 +204,29 @@ def secure_resolver(
         Decorated resolver function
     """
 
+    required = _role_values(required_roles or ())
+
     def decorator(resolver_func: Callable) -> Callable:
         @wraps(resolver_func)
         def wrapper(self, info, **kwargs):
             user = info.context.user
 
             # Check authentication
-            if required_roles and isinstance(user, AnonymousUser):
+            if required and isinstance(user, AnonymousUser):
                 raise PermissionDenied("Authentication required")
 
             # Check roles
-            if required_roles:
-                user_roles = getattr(user, "roles", [])
-                if (
-                    not any(role in required_roles for role in user_roles)
-                    and not user.is_staff
-                ):
+            if required:
+                user_roles = _context_roles(info.context, user)
+                if user_roles.isdisjoint(required) and not user.is_staff:
                     raise PermissionDenied("Insufficient permissions")
 
             # Audit logging
-            if audit:
+            if audit and logger.isEnabledFor(logging.INFO):
                 logger.info(
-                    f"GraphQL operation: {resolver_func.__name__} by user: {user.username if hasattr(user, 'username') else 'anonymous'}"
+                    "GraphQL operation: %s by user: %s",
+                    resolver_func.__name__,
+                    getattr(user, "username", "anonymous"),
                 )
 
             # Input validation
@@ -198,6 +278,7 @@ def require_authentication(resolver_func: Callable) -> Callable:
 
 def require_role(role: str):
     """Decorator to require a specific role for a resolver."""
+    role_value = getattr(role, "value", role)
 
     def decorator(resolver_func: Callable) -> Callable:
         @wraps(resolver_func)
@@ -206,8 +287,8 @@ def require_role(role: str):
             if isinstance(user, AnonymousUser):
                 raise PermissionDenied("Authentication required")
 
-            user_roles = getattr(user, "roles", [])
-            if role not in user_roles and not user.is_staff:
+            user_roles = _context_roles(info.context, user)
+            if role_value not in user_roles and not user.is_staff:
                 raise PermissionDenied(f"Role '{role}' required")
 
             return resolver_func(self, info, *args, **kwargs)
@@ -244,9 +325,7 @@ def validate_input(required_fields: List[str]):
             for field, value in input_data.items():
                 if isinstance(value, str):
                     # Remove potentially dangerous HTML/script tags
-                    input_data[field] = value.replace("<script>", "").replace(
-                        "</script>", ""
-                    )
+                    input_data[field] = _SCRIPT_TAG_RE.sub("", value)
 
             return func(self, info, *args, **kwargs)
 
@@ -266,24 +345,28 @@ def audit_operation(operation_name: str):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Handle both method calls (with self, info) and function calls
-            if len(args) >= 2 and hasattr(args[1], "context"):
-                # GraphQL resolver method call
-                info = args[1]
-                user = getattr(info.context, "user", "Anonymous")
-            else:
-                # Regular function call
-                user = "Test"
-
-            logger.info(f"AUDIT: {operation_name} performed by {user}")
+            # Skip resolving the user entirely when INFO records are dropped
+            log_info = logger.isEnabledFor(logging.INFO)
+            if log_info:
+                # Handle both method calls (with self, info) and function calls
+                if len(args) >= 2 and hasattr(args[1], "context"):
+                    # GraphQL resolver method call
+                    info = args[1]
+                    user = getattr(info.context, "user", "Anonymous")
+                else:
+                    # Regular function call
+                    user = "Test"
+
+                logger.info("AUDIT: %s performed by %s", operation_name, user)
 
             try:
                 result = func(*args, **kwargs)
-                logger.info(f"AUDIT: {operation_name} completed successfully")
-                return result
             except Exception as e:
-                logger.error(f"AUDIT: {operation_name} failed: {str(e)}")
+                logger.error("AUDIT: %s failed: %s", operation_name, e)
                 raise
+            if log_info:
+                logger.info("AUDIT: %s completed successfully", operation_name)
+            return result
 
         return wrapper
 
@@ -300,31 +383,21 @@ def _validate_input_data(data: Dict[str, Any]) -> None:
     Raises:
         ValueError: If validation fails
     """
-    # Check for common injection patterns
-    dangerous_patterns = [
-        "<script",
-        "javascript:",
-        "onload=",
-        "onerror=",
-        "DROP TABLE",
-        "DELETE FROM",
-    ]
-
-    def check_value(value):
+    # Walk nested dicts/lists with an explicit stack instead of recursion.
+    # Children are pushed reversed so values are visited in document order
+    # and the first dangerous value reported is the one recursion found.
+    pending = list(reversed(data.values()))
+    while pending:
+        value = pending.pop()
         if isinstance(value, str):
-            value_lower = value.lower()
-            for pattern in dangerous_patterns:
-                if pattern.lower() in value_lower:
-                    raise ValueError(f"Potentially dangerous input detected: {pattern}")
+            match = _DANGEROUS_RE.search(value)
+            if match:
+                pattern = _DANGEROUS_BY_MATCH[match.group().lower()]
+                raise ValueError(f"Potentially dangerous input detected: {pattern}")
         elif isinstance(value, dict):
-            for v in value.values():
-                check_value(v)
+            pending.extend(reversed(value.values()))
         elif isinstance(value, list):
-            for item in value:
-                check_value(item)
-
-    for value in data.values():
-        check_value(value)
+            pending.extend(reversed(value))
 
 
 # Security configuration registry
@@ -0,0 +1,110 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from .managers import invalidate_published_cache
+from .models import AuthorStats, Category, Comment, Post, Tag
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(m2m_changed, sender=Post.tags.through)
+def expire_published_cache(sender, **kwargs):
+    """Expire cached published post querysets when their rows change."""
+    invalidate_published_cache()
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def expire_active_cache(sender, **kwargs):
+    """Expire the cached active category/tag list."""
+    sender.objects.invalidate_active_cache()
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def sync_post_comment_count(sender, instance, **kwargs):
+    """Keep Post.comment_count in step with approved comments."""
+    Post.refresh_comment_count([instance.post_id])
+    invalidate_published_cache()
+
+
+@receiver(pre_save, sender=Comment)
+def remember_comment_author(sender, instance, update_fields=None, **kwargs):
+    """Capture the stored author of a comment whose author may be reassigned."""
+    if instance.pk is None:
+        return
+    if update_fields is not None and {"author", "author_id"}.isdisjoint(update_fields):
+        return
+    instance._previous_author_id = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list("author_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def sync_author_comment_count(sender, instance, signal, created=False, **kwargs):
+    """Keep AuthorStats.comment_count in step with the author's comments.
+
+    The count covers every comment, approved or not, so only creating,
+    deleting or reassigning a comment changes it.
+    """
+    author_ids = [instance.author_id]
+    if signal is post_save:
+        previous_author_id = instance.__dict__.pop("_previous_author_id", None)
+        if not created:
+            if previous_author_id in (None, instance.author_id):
+                return
+            author_ids.append(previous_author_id)
+        AuthorStats.objects.get_or_create(user_id=instance.author_id)
+    AuthorStats.refresh_comment_count(author_ids)
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def sync_post_tag_names(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep Post.tag_names in step with the tags relation."""
+    if action == "pre_clear" and reverse:
+        # The affected posts are only known before a reverse clear runs
+        instance._cleared_post_ids = list(instance.posts.values_list("pk", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        post_ids = [instance.pk]
+    elif action == "post_clear":
+        post_ids = getattr(instance, "_cleared_post_ids", [])
+    else:
+        post_ids = list(pk_set)
+    Post.refresh_tag_names(post_ids)
+
+
+@receiver(post_save, sender=Tag)
+def sync_renamed_tag_names(sender, instance, created, **kwargs):
+    """Refresh Post.tag_names on posts carrying a tag that was renamed."""
+    if not created:
+        Post.refresh_tag_names(list(instance.posts.values_list("pk", flat=True)))
+
+
+@receiver(pre_delete, sender=Tag)
+def remember_tagged_posts(sender, instance, **kwargs):
+    """Capture posts carrying a tag before the cascade removes the links."""
+    instance._tagged_post_ids = list(instance.posts.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Tag)
+def sync_deleted_tag_names(sender, instance, **kwargs):
+    """Refresh Post.tag_names on posts that carried a deleted tag."""
+    Post.refresh_tag_names(getattr(instance, "_tagged_post_ids", []))
@@ -0,0 +1,139 @@
+"""
+Tests for the blog managers' batched writes and pagination helpers.
+"""
+
+import base64
+from datetime import timedelta
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from ..managers import decode_post_cursor, encode_post_cursor
+from ..models import Post, Subscriber
+
+User = get_user_model()
+
+
+class SubscriberManagerTestCase(TestCase):
+    """Test batched subscriber imports."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Subscriber.objects.create(email="known@example.com")
+
+    def test_bulk_subscribe_skips_existing_and_repeated_emails(self):
+        inserted = Subscriber.objects.bulk_subscribe(
+            [
+                "known@example.com",
+                "new1@example.com",
+                "new2@example.com",
+                "new1@example.com",
+                "new3@example.com",
+            ],
+            batch_size=2,
+        )
+
+        self.assertEqual(inserted, 3)
+        self.assertEqual(
+            set(Subscriber.objects.values_list("email", flat=True)),
+            {
+                "known@example.com",
+                "new1@example.com",
+                "new2@example.com",
+                "new3@example.com",
+            },
+        )
+        # Running the same import again inserts nothing
+        self.assertEqual(Subscriber.objects.bulk_subscribe(["new2@example.com"]), 0)
+
+
+class PostCursorTestCase(SimpleTestCase):
+    """Test the opaque keyset cursor encoding."""
+
+    def test_round_trip(self):
+        published_at = timezone.now().replace(microsecond=123456)
+        cursor = encode_post_cursor(SimpleNamespace(published_at=published_at, pk=42))
+
+        self.assertEqual(decode_post_cursor(cursor), (published_at, 42))
+
+    def test_invalid_cursors_raise_value_error(self):
+        def b64(raw):
+            return base64.urlsafe_b64encode(raw).decode()
+
+        invalid = [
+            "",
+            "not base64!",
+            b64(b"no-separator"),
+            b64(b"not-a-date|1"),
+            b64(b"2026-10-15T12:00:00+00:00|not-an-id"),
+            b64(b"2026-10-15T12:00:00+00:00|1|extra"),
+            b64(b"\xff\xfe|1"),
+        ]
+        for cursor in invalid:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(ValueError):
+                    decode_post_cursor(cursor)
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "blog-manager-tests",
+        }
+    }
+)
+class PublishedPageAfterTestCase(TestCase):
+    """Test keyset pagination over published posts."""
+
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user(username="writer", password="x")
+        now = timezone.now()
+        # Five posts share one timestamp so pages must split ties by id
+        timestamps = [now] * 5 + [now - timedelta(hours=n) for n in (1, 2, 3)]
+        Post.objects.bulk_create(
+            [
+                Post(
+                    title=f"Post {n}",
+                    slug=f"post-{n}",
+                    author=author,
+                    status=Post.Status.PUBLISHED,
+                    published_at=published_at,
+                )
+                for n, published_at in enumerate(timestamps)
+            ]
+            + [
+                Post(title="Draft", slug="draft", author=author, published_at=now),
+                # Published without a date (e.g. set by hand in the admin)
+                Post(
+                    title="Undated",
+                    slug="undated",
+                    author=author,
+                    status=Post.Status.PUBLISHED,
+                ),
+            ]
+        )
+        cls.expected_ids = list(
+            Post.objects.filter(
+                status=Post.Status.PUBLISHED, published_at__isnull=False
+            )
+            .order_by("-published_at", "-pk")
+            .values_list("pk", flat=True)
+        )
+
+    def test_pages_have_no_duplicates_or_gaps(self):
+        for size in (1, 2, 3, 5):
+            with self.subTest(page_size=size):
+                seen, cursor = [], None
+                while True:
+                    page = list(Post.published.page_after(cursor, first=size))
+                    if not page:
+                        break
+                    self.assertLessEqual(len(page), size)
+                    seen.extend(post.pk for post in page)
+                    cursor = encode_post_cursor(page[-1])
+
+                self.assertEqual(seen, self.expected_ids)
@@ -0,0 +1,331 @@
+"""
+Tests for the blog models' denormalized counters and write buffers.
+"""
+
+import threading
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from ..models import AuthorStats, Category, Comment, Post, Tag
+
+User = get_user_model()
+
+LOCMEM_CACHE = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "blog-model-tests",
+    }
+}
+
+
+class FakeRedis:
+    """In-memory stand-in for the hash commands the view buffer issues."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.lock = threading.Lock()
+
+    def hincrby(self, name, key, amount=1):
+        with self.lock:
+            bucket = self.hashes.setdefault(name, {})
+            field = str(key).encode()
+            bucket[field] = bucket.get(field, 0) + amount
+            return bucket[field]
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and runs them atomically on ``execute()``."""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def hgetall(self, name):
+        self.commands.append(
+            lambda: {
+                field: str(value).encode()
+                for field, value in self.client.hashes.get(name, {}).items()
+            }
+        )
+
+    def delete(self, name):
+        self.commands.append(
+            lambda: int(self.client.hashes.pop(name, None) is not None)
+        )
+
+    def execute(self):
+        with self.client.lock:
+            return [command() for command in self.commands]
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class PostViewCountTestCase(TestCase):
+    """Test that buffered page views reach Post.view_count exactly once."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username="writer", password="x")
+        cls.category = Category.objects.create(name="News", slug="news")
+        cls.post = Post.objects.create(
+            title="Counted",
+            slug="counted",
+            content="Body",
+            author=cls.author,
+            category=cls.category,
+            status=Post.Status.PUBLISHED,
+        )
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = patch.object(Post, "_redis_client", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assertViewCount(self, expected):
+        self.post.refresh_from_db(fields=["view_count"])
+        self.assertEqual(self.post.view_count, expected)
+
+    def test_flush_applies_accumulated_views(self):
+        for _ in range(3):
+            Post.increment_views(self.post.pk)
+        self.assertViewCount(0)
+
+        self.assertEqual(Post.flush_view_counts(), 1)
+        self.assertViewCount(3)
+
+    def test_flush_clears_the_buffer(self):
+        Post.increment_views(self.post.pk)
+        Post.flush_view_counts()
+
+        self.assertEqual(Post._pop_view_deltas(), {})
+        self.assertEqual(Post.flush_view_counts(), 0)
+        self.assertViewCount(1)
+
+    def test_concurrent_increments_are_not_lost(self):
+        def hammer():
+            for _ in range(50):
+                Post.increment_views(self.post.pk)
+
+        threads = [threading.Thread(target=hammer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        Post.flush_view_counts()
+        self.assertViewCount(200)
+
+    def test_view_buffered_during_flush_survives(self):
+        for _ in range(3):
+            Post.increment_views(self.post.pk)
+        pop_view_deltas = Post._pop_view_deltas
+
+        def pop_then_view():
+            # A view lands after the buffer is read, before the UPDATE
+            deltas = pop_view_deltas()
+            Post.increment_views(self.post.pk)
+            return deltas
+
+        with patch.object(Post, "_pop_view_deltas", side_effect=pop_then_view):
+            Post.flush_view_counts()
+        self.assertViewCount(3)
+
+        Post.flush_view_counts()
+        self.assertViewCount(4)
+
+    def test_without_redis_views_are_written_through(self):
+        with patch.object(Post, "_redis_client", return_value=None):
+            Post.increment_views(self.post.pk)
+            Post.increment_views(self.post.pk)
+            self.assertViewCount(2)
+            self.assertEqual(Post.flush_view_counts(), 0)
+        self.assertViewCount(2)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class PostCommentCountTestCase(TestCase):
+    """Test that Post.comment_count tracks approved comments on every path."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username="writer", password="x")
+        cls.reader = User.objects.create_user(username="reader", password="x")
+        cls.post, cls.other_post = [
+            Post.objects.create(
+                title=f"Post {n}",
+                slug=f"post-{n}",
+                author=cls.author,
+                status=Post.Status.PUBLISHED,
+            )
+            for n in (1, 2)
+        ]
+
+    def comment(self, post=None, approved=False):
+        return Comment.objects.create(
+            post=post or self.post,
+            author=self.reader,
+            content="Nice post",
+            is_approved=approved,
+        )
+
+    def assertCommentCount(self, post, expected):
+        post.refresh_from_db(fields=["comment_count"])
+        self.assertEqual(post.comment_count, expected)
+
+    def test_save_and_delete(self):
+        comment = self.comment()
+        self.assertCommentCount(self.post, 0)
+
+        comment.is_approved = True
+        comment.save()
+        self.assertCommentCount(self.post, 1)
+
+        comment.is_approved = False
+        comment.save(update_fields=["is_approved"])
+        self.assertCommentCount(self.post, 0)
+
+        approved = self.comment(approved=True)
+        self.assertCommentCount(self.post, 1)
+        approved.delete()
+        self.assertCommentCount(self.post, 0)
+
+    def test_bulk_approve(self):
+        pending = [self.comment() for _ in range(3)]
+        self.comment(post=self.other_post)
+
+        approved = Comment.objects.bulk_approve([c.pk for c in pending])
+
+        self.assertEqual(approved, 3)
+        self.assertCommentCount(self.post, 3)
+        self.assertCommentCount(self.other_post, 0)
+        # Already approved comments are not counted twice
+        self.assertEqual(Comment.objects.bulk_approve([pending[0].pk]), 0)
+        self.assertCommentCount(self.post, 3)
+
+    def test_queryset_update_and_delete(self):
+        comments = [self.comment(approved=True) for _ in range(2)]
+        self.assertCommentCount(self.post, 2)
+
+        Comment.objects.filter(pk=comments[0].pk).update(is_approved=False)
+        self.assertCommentCount(self.post, 1)
+
+        Comment.objects.filter(pk=comments[1].pk).update(post=self.other_post)
+        self.assertCommentCount(self.post, 0)
+        self.assertCommentCount(self.other_post, 1)
+
+        Comment.objects.filter(post=self.other_post).delete()
+        self.assertCommentCount(self.other_post, 0)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class PostTagNamesTestCase(TestCase):
+    """Test that Post.tag_names mirrors the tags relation, sorted by name."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username="writer", password="x")
+        cls.post, cls.other_post, cls.untagged = [
+            Post.objects.create(title=f"Post {n}", slug=f"post-{n}", author=cls.author)
+            for n in (1, 2, 3)
+        ]
+        cls.django, cls.python = [
+            Tag.objects.create(name=name, slug=name.lower())
+            for name in ("Django", "Python")
+        ]
+
+    def assertTagNames(self, post, expected):
+        post.refresh_from_db(fields=["tag_names"])
+        self.assertEqual(post.tag_names, expected)
+
+    def test_add_rename_and_delete(self):
+        self.post.tags.add(self.python, self.django)
+        self.other_post.tags.add(self.python)
+        self.assertTagNames(self.post, ["Django", "Python"])
+        self.assertTagNames(self.other_post, ["Python"])
+
+        self.python.name = "Async"
+        self.python.save()
+        self.assertTagNames(self.post, ["Async", "Django"])
+        self.assertTagNames(self.other_post, ["Async"])
+
+        self.python.delete()
+        self.assertTagNames(self.post, ["Django"])
+        self.assertTagNames(self.other_post, [])
+
+    def test_refresh_empties_posts_without_tags(self):
+        Post.objects.filter(pk=self.untagged.pk).update(tag_names=["Stale"])
+
+        Post.refresh_tag_names([self.untagged.pk])
+
+        self.assertTagNames(self.untagged, [])
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class AuthorStatsTestCase(TestCase):
+    """Test that AuthorStats.comment_count follows each comment's author."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.writer = User.objects.create_user(username="writer", password="x")
+        cls.alice = User.objects.create_user(username="alice", password="x")
+        cls.bob = User.objects.create_user(username="bob", password="x")
+        cls.post = Post.objects.create(title="Thread", slug="thread", author=cls.writer)
+
+    def comment(self, author):
+        return Comment.objects.create(post=self.post, author=author, content="Hi")
+
+    def assertStats(self, user, expected):
+        self.assertEqual(AuthorStats.objects.get(user=user).comment_count, expected)
+
+    def test_create_approve_and_delete(self):
+        comment = self.comment(self.alice)
+        self.assertStats(self.alice, 1)
+
+        # Every comment counts, so moderation leaves the number alone
+        comment.is_approved = True
+        comment.save()
+        self.assertStats(self.alice, 1)
+
+        comment.delete()
+        self.assertStats(self.alice, 0)
+
+    def test_reassign_author_on_save(self):
+        comment = self.comment(self.alice)
+        self.assertFalse(AuthorStats.objects.filter(user=self.bob).exists())
+
+        comment.author = self.bob
+        comment.save(update_fields=["author"])
+
+        self.assertStats(self.alice, 0)
+        self.assertStats(self.bob, 1)
+
+    def test_reassign_author_on_queryset_update(self):
+        comments = [self.comment(self.alice) for _ in range(2)]
+
+        Comment.objects.filter(pk=comments[0].pk).update(author=self.bob)
+
+        self.assertStats(self.alice, 1)
+        self.assertStats(self.bob, 1)
+
+    def test_new_activity_includes_authors_without_stats(self):
+        # bulk_create skips signals, so bob never gets a stats row
+        Comment.objects.bulk_create(
+            [Comment(post=self.post, author=self.bob, content="Quiet")]
+        )
+        for _ in range(5):
+            self.comment(self.alice)
+
+        new = Comment.filter_by_author_activity(
+            Comment.objects.all(), "author_activity", "new"
+        )
+        active = Comment.filter_by_author_activity(
+            Comment.objects.all(), "author_activity", "active"
+        )
+
+        self.assertEqual({c.author_id for c in new}, {self.bob.pk})
+        self.assertEqual({c.author_id for c in active}, {self.alice.pk})
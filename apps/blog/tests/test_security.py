@@ -2,29 +2,143 @@
 Comprehensive security tests for the blog app GraphQL schema.
 """
 import json
-from unittest.mock import patch, MagicMock
-from django.test import TestCase, RequestFactory
+from types import SimpleNamespace
+from unittest.mock import patch
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from graphene.test import Client
 from graphql import GraphQLError
 
+from config.schema import schema
+
+from ..managers import invalidate_published_cache
 from ..models import Category, Tag, Post, Comment, Subscriber, BlogSettings
-from ..schema import schema
-from ..security import BlogRoles, FieldAccessLevel
+from ..security import (
+    BlogRoles,
+    FieldAccessLevel,
+    _validate_input_data,
+    audit_operation,
+    encrypt_sensitive_field,
+    require_authentication,
+    require_role,
+    secure_resolver,
+    validate_input,
+)
 
 User = get_user_model()
 
 
+# GraphQL documents shared by the tests, built once at import
+POSTS_QUERY = '''
+    query {
+        posts {
+            edges {
+                node {
+                    id
+                    title
+                    status
+                }
+            }
+        }
+    }
+'''
+
+SUBSCRIBERS_QUERY = '''
+    query {
+        subscribers {
+            edges {
+                node {
+                    id
+                    email
+                }
+            }
+        }
+    }
+'''
+
+COMMENTS_QUERY = '''
+    query {
+        comments {
+            edges {
+                node {
+                    id
+                    content
+                    isApproved
+                }
+            }
+        }
+    }
+'''
+
+CREATE_POST_MUTATION = '''
+    mutation {
+        createPost(input: {
+            title: "New Post"
+            slug: "new-post"
+            content: "New content"
+            categoryId: "%s"
+        }) {
+            success
+            errors
+            post {
+                id
+                title
+            }
+        }
+    }
+'''
+
+CREATE_CATEGORY_MUTATION = '''
+    mutation {
+        createCategory(input: {
+            name: "New Category"
+            slug: "new-category"
+            description: "New description"
+        }) {
+            success
+            errors
+            category {
+                id
+                name
+            }
+        }
+    }
+'''
+
+CREATE_EMPTY_TITLE_POST_MUTATION = '''
+    mutation {
+        createPost(input: {
+            title: ""
+            slug: "empty-title"
+            content: "Some content"
+            categoryId: "%s"
+        }) {
+            success
+            errors
+        }
+    }
+'''
+
+
+# PBKDF2 is deliberately slow; fixtures only need some hash
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']
+)
 class BlogSecurityTestCase(TestCase):
     """Test case for blog app security features."""
     
-    def setUp(self):
-        """Set up test data and users."""
-        self.factory = RequestFactory()
-        
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Built once; kept out of setUpTestData so it is not deep-copied per test
+        cls.graphql_client = Client(schema)
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data and users once for the whole test case."""
         # Create test users with different roles
-        self.admin_user = User.objects.create_user(
+        cls.admin_user = User.objects.create_user(
             username='admin',
             email='admin@test.com',
             password='testpass123',
@@ -32,166 +146,122 @@ class BlogSecurityTestCase(TestCase):
             is_superuser=True
         )
         
-        self.editor_user = User.objects.create_user(
+        cls.editor_user = User.objects.create_user(
             username='editor',
             email='editor@test.com',
             password='testpass123'
         )
         # Simulate role assignment
-        self.editor_user.roles = [BlogRoles.EDITOR.value]
+        cls.editor_user.roles = frozenset({BlogRoles.EDITOR.value})
         
-        self.author_user = User.objects.create_user(
+        cls.author_user = User.objects.create_user(
             username='author',
             email='author@test.com',
             password='testpass123'
         )
-        self.author_user.roles = [BlogRoles.AUTHOR.value]
+        cls.author_user.roles = frozenset({BlogRoles.AUTHOR.value})
         
-        self.subscriber_user = User.objects.create_user(
+        cls.subscriber_user = User.objects.create_user(
             username='subscriber',
             email='subscriber@test.com',
             password='testpass123'
         )
-        self.subscriber_user.roles = [BlogRoles.READER.value]
+        cls.subscriber_user.roles = frozenset({BlogRoles.READER.value})
         
-        self.anonymous_user = AnonymousUser()
+        cls.anonymous_user = AnonymousUser()
         
         # Create test data
-        self.category = Category.objects.create(
+        cls.category = Category.objects.create(
             name='Test Category',
             slug='test-category',
             description='Test description'
         )
         
-        self.tag = Tag.objects.create(
+        cls.tag = Tag.objects.create(
             name='Test Tag',
             slug='test-tag'
         )
         
-        self.published_post = Post.objects.create(
-            title='Published Post',
-            slug='published-post',
-            content='Published content',
-            excerpt='Published excerpt',
-            category=self.category,
-            author=self.author_user,
-            status='published'
-        )
-        
-        self.draft_post = Post.objects.create(
-            title='Draft Post',
-            slug='draft-post',
-            content='Draft content',
-            excerpt='Draft excerpt',
-            category=self.category,
-            author=self.author_user,
-            status='draft'
-        )
-        
-        self.comment = Comment.objects.create(
-            post=self.published_post,
-            author=self.subscriber_user,
+        # One INSERT for both posts; Postgres returns the new primary keys.
+        # bulk_create skips post_save, so run its side effects by hand.
+        cls.published_post, cls.draft_post = Post.objects.bulk_create([
+            Post(
+                title='Published Post',
+                slug='published-post',
+                content='Published content',
+                excerpt='Published excerpt',
+                category=cls.category,
+                author=cls.author_user,
+                status=Post.Status.PUBLISHED
+            ),
+            Post(
+                title='Draft Post',
+                slug='draft-post',
+                content='Draft content',
+                excerpt='Draft excerpt',
+                category=cls.category,
+                author=cls.author_user,
+                status=Post.Status.DRAFT
+            ),
+        ])
+        post_ids = [cls.published_post.pk, cls.draft_post.pk]
+        Post.refresh_comment_count(post_ids)
+        Post.refresh_tag_names(post_ids)
+        invalidate_published_cache()
+        
+        cls.comment = Comment.objects.create(
+            post=cls.published_post,
+            author=cls.subscriber_user,
             content='Test comment',
             is_approved=True
         )
         
-        self.subscriber = Subscriber.objects.create(
+        cls.subscriber = Subscriber.objects.create(
             email='test@example.com',
             is_active=True
         )
         
-        self.blog_settings = BlogSettings.objects.create(
+        cls.blog_settings = BlogSettings.objects.create(
             site_title='Test Blog',
             site_description='Test Description'
         )
     
     def create_context(self, user):
-        """Create a mock GraphQL context with user."""
-        request = self.factory.get('/')
-        request.user = user
-        context = MagicMock()
-        context.user = user
-        return context
+        """Create a lightweight GraphQL context carrying the user."""
+        return SimpleNamespace(user=user, META={}, session={})
     
-    def test_anonymous_user_access(self):
-        """Test that anonymous users can only access published content."""
-        client = Client(schema)
-        context = self.create_context(self.anonymous_user)
-        
-        # Test posts query - should only return published posts
-        query = '''
-            query {
-                posts {
-                    edges {
-                        node {
-                            id
-                            title
-                            status
-                        }
-                    }
-                }
-            }
-        '''
-        
-        result = client.execute(query, context=context)
-        self.assertIsNone(result.get('errors'))
-        
-        posts = result['data']['posts']['edges']
-        self.assertEqual(len(posts), 1)
-        self.assertEqual(posts[0]['node']['title'], 'Published Post')
-    
-    def test_authenticated_user_post_access(self):
-        """Test that authenticated users can access their own drafts."""
-        client = Client(schema)
-        context = self.create_context(self.author_user)
-        
-        query = '''
-            query {
-                posts {
-                    edges {
-                        node {
-                            id
-                            title
-                            status
-                        }
-                    }
-                }
-            }
-        '''
-        
-        result = client.execute(query, context=context)
-        self.assertIsNone(result.get('errors'))
-        
-        posts = result['data']['posts']['edges']
-        # Author should see both published and their own draft posts
-        self.assertEqual(len(posts), 2)
+    def test_post_visibility_by_role(self):
+        """Test that anonymous users only see published posts and authors
+        also see their own drafts."""
+        cases = [
+            ('anonymous', self.anonymous_user, ['Published Post']),
+            ('author', self.author_user, ['Published Post', 'Draft Post']),
+        ]
+        for label, user, expected_titles in cases:
+            with self.subTest(user=label):
+                result = self.graphql_client.execute(
+                    POSTS_QUERY, context=self.create_context(user)
+                )
+                self.assertIsNone(result.get('errors'))
+                
+                posts = result['data']['posts']['edges']
+                self.assertCountEqual(
+                    [post['node']['title'] for post in posts], expected_titles
+                )
     
     def test_admin_subscriber_access(self):
         """Test that only admins can access subscriber data."""
-        client = Client(schema)
-        
         # Test with admin user
         admin_context = self.create_context(self.admin_user)
-        query = '''
-            query {
-                subscribers {
-                    edges {
-                        node {
-                            id
-                            email
-                        }
-                    }
-                }
-            }
-        '''
+        query = SUBSCRIBERS_QUERY
         
-        result = client.execute(query, context=admin_context)
+        result = self.graphql_client.execute(query, context=admin_context)
         # Should work for admin
         self.assertIsNone(result.get('errors'))
         
         # Test with regular user
         user_context = self.create_context(self.subscriber_user)
-        result = client.execute(query, context=user_context)
+        result = self.graphql_client.execute(query, context=user_context)
         # Should fail for regular user
         self.assertIsNotNone(result.get('errors'))
     
@@ -205,25 +275,11 @@ class BlogSecurityTestCase(TestCase):
             is_approved=False
         )
         
-        client = Client(schema)
-        
         # Test with anonymous user
         anon_context = self.create_context(self.anonymous_user)
-        query = '''
-            query {
-                comments {
-                    edges {
-                        node {
-                            id
-                            content
-                            isApproved
-                        }
-                    }
-                }
-            }
-        '''
+        query = COMMENTS_QUERY
         
-        result = client.execute(query, context=anon_context)
+        result = self.graphql_client.execute(query, context=anon_context)
         self.assertIsNone(result.get('errors'))
         
         comments = result['data']['comments']['edges']
@@ -233,29 +289,11 @@ class BlogSecurityTestCase(TestCase):
     
     def test_create_post_permissions(self):
         """Test that only authorized users can create posts."""
-        client = Client(schema)
-        
-        mutation = '''
-            mutation {
-                createPost(input: {
-                    title: "New Post"
-                    slug: "new-post"
-                    content: "New content"
-                    categoryId: "%s"
-                }) {
-                    success
-                    errors
-                    post {
-                        id
-                        title
-                    }
-                }
-            }
-        ''' % self.category.id
+        mutation = CREATE_POST_MUTATION % self.category.id
         
         # Test with author user (should work)
         author_context = self.create_context(self.author_user)
-        result = client.execute(mutation, context=author_context)
+        result = self.graphql_client.execute(mutation, context=author_context)
         
         if result.get('errors'):
             # If there are GraphQL errors, check if it's due to authentication
@@ -270,28 +308,11 @@ class BlogSecurityTestCase(TestCase):
     
     def test_create_category_admin_only(self):
         """Test that only admins and editors can create categories."""
-        client = Client(schema)
-        
-        mutation = '''
-            mutation {
-                createCategory(input: {
-                    name: "New Category"
-                    slug: "new-category"
-                    description: "New description"
-                }) {
-                    success
-                    errors
-                    category {
-                        id
-                        name
-                    }
-                }
-            }
-        '''
+        mutation = CREATE_CATEGORY_MUTATION
         
         # Test with subscriber user (should fail)
         subscriber_context = self.create_context(self.subscriber_user)
-        result = client.execute(mutation, context=subscriber_context)
+        result = self.graphql_client.execute(mutation, context=subscriber_context)
         
         # Should have errors due to insufficient permissions
         self.assertIsNotNone(result.get('errors'))
@@ -299,7 +320,7 @@ class BlogSecurityTestCase(TestCase):
     def test_sensitive_field_encryption(self):
         """Test that sensitive fields are properly handled."""
         # Test subscriber email field (marked as sensitive)
-        subscriber = Subscriber.objects.get(email='test@example.com')
+        subscriber = self.subscriber
         
         # The email should be stored (potentially encrypted)
         self.assertIsNotNone(subscriber.email)
@@ -307,25 +328,11 @@ class BlogSecurityTestCase(TestCase):
     
     def test_input_validation(self):
         """Test that input validation works correctly."""
-        client = Client(schema)
-        
         # Test with invalid input (empty title)
-        mutation = '''
-            mutation {
-                createPost(input: {
-                    title: ""
-                    slug: "empty-title"
-                    content: "Some content"
-                    categoryId: "%s"
-                }) {
-                    success
-                    errors
-                }
-            }
-        ''' % self.category.id
+        mutation = CREATE_EMPTY_TITLE_POST_MUTATION % self.category.id
         
         author_context = self.create_context(self.author_user)
-        result = client.execute(mutation, context=author_context)
+        result = self.graphql_client.execute(mutation, context=author_context)
         
         # Should have validation errors or GraphQL errors
         has_errors = (result.get('errors') is not None or 
@@ -335,13 +342,44 @@ class BlogSecurityTestCase(TestCase):
         
         self.assertTrue(has_errors)
     
+    def test_model_security_metadata_is_resolved(self):
+        """Test that secure_model resolves roles once into a frozen table."""
+        meta = Category._secure_meta
+
+        self.assertEqual(
+            meta['roles'],
+            frozenset({BlogRoles.EDITOR.value, BlogRoles.ADMIN.value})
+        )
+        self.assertEqual(
+            meta['field_permissions']['is_active'], FieldAccessLevel.ADMIN_ONLY
+        )
+        with self.assertRaises(TypeError):
+            meta['roles'] = frozenset()
+
+        # Enum-configured roles match string roles carried by users
+        self.assertTrue(self.category.check_role_access(self.editor_user))
+        self.assertFalse(self.category.check_role_access(self.subscriber_user))
+        self.assertFalse(self.category.check_role_access(self.anonymous_user))
+
+    def test_user_role_assignment(self):
+        """Test that fixture users carry their simulated roles."""
+        self.assertEqual(self.editor_user.roles, frozenset({'EDITOR'}))
+        self.assertEqual(self.author_user.roles, frozenset({'AUTHOR'}))
+    
+    def tearDown(self):
+        """Clean up test data."""
+        # Clean up is handled by Django's test framework
+        pass
+
+
+class BlogSecurityImportsTestCase(SimpleTestCase):
+    """Security checks that need no database fixtures."""
+    
     def test_audit_logging_structure(self):
         """Test that audit logging decorators are properly structured."""
         # This test verifies that the audit decorators are in place
         # In a real implementation, you would check actual log entries
         
-        from ..security import audit_operation
-        
         # Verify the decorator exists and is callable
         self.assertTrue(callable(audit_operation))
         
@@ -355,22 +393,14 @@ class BlogSecurityTestCase(TestCase):
     
     def test_role_based_access_control(self):
         """Test role-based access control functionality."""
-        from ..security import BlogRoles
-        
         # Test role enumeration
         self.assertEqual(BlogRoles.ADMIN.value, 'ADMIN')
         self.assertEqual(BlogRoles.EDITOR.value, 'EDITOR')
         self.assertEqual(BlogRoles.AUTHOR.value, 'AUTHOR')
         self.assertEqual(BlogRoles.READER.value, 'READER')
-        
-        # Test user role assignment
-        self.assertEqual(getattr(self.editor_user, 'roles', []), [BlogRoles.EDITOR.value])
-        self.assertEqual(getattr(self.author_user, 'roles', []), [BlogRoles.AUTHOR.value])
     
     def test_field_access_levels(self):
         """Test field access level enumeration."""
-        from ..security import FieldAccessLevel
-        
         # Test access level enumeration
         self.assertEqual(FieldAccessLevel.PUBLIC.value, 'public')
         self.assertEqual(FieldAccessLevel.AUTHENTICATED.value, 'authenticated')
@@ -380,11 +410,6 @@ class BlogSecurityTestCase(TestCase):
     
     def test_security_decorators_exist(self):
         """Test that all security decorators are properly defined."""
-        from ..security import (
-            secure_resolver, require_authentication, require_role,
-            validate_input, audit_operation, encrypt_sensitive_field
-        )
-        
         # Verify all decorators exist and are callable
         decorators = [
             secure_resolver, require_authentication, require_role,
@@ -404,7 +429,22 @@ class BlogSecurityTestCase(TestCase):
             # This would be implementation-specific
             self.assertTrue(hasattr(model, '__name__'))  # Basic model check
     
-    def tearDown(self):
-        """Clean up test data."""
-        # Clean up is handled by Django's test framework
-        pass
\ No newline at end of file
+    def test_nested_input_validation(self):
+        """Test that dangerous values are found at any depth, first one first."""
+        safe = {'input': {'title': 'Hello', 'tags': ['a', {'name': 'b'}]}}
+        _validate_input_data(safe)
+        
+        nested = {
+            'input': {
+                'title': 'Hello',
+                'blocks': [
+                    {'body': 'fine'},
+                    {'meta': {'links': ['javascript:alert(1)']}},
+                ],
+                'footer': '<SCRIPT>x</SCRIPT>',
+            }
+        }
+        with self.assertRaisesMessage(
+            ValueError, 'Potentially dangerous input detected: javascript:'
+        ):
+            _validate_input_data(nested)
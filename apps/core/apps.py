@@ -0,0 +1,47 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.core"
+
+    def ready(self):
+        # Register the GraphQL schemas once, after the app registry is loaded
+        from rail_django_graphql.core.registry import schema_registry
+
+        # Open blog schema
+        schema_registry.register_schema(
+            name="blog",
+            description="Blog content API",
+            settings={
+                "authentication_required": True,
+                "schema_settings": {
+                    "disable_security_mutations": False,
+                    "show_metadata": True,
+                },
+                "type_generation_settings": {},
+                "query_settings": {"default_page_size": 20, "max_page_size": 100},
+                "mutation_settings": {
+                    "enable_create": True,
+                    "generate_update": False,
+                    "generate_delete": False,
+                },
+            },
+            enabled=True,
+        )
+
+        # Closed authentication schema
+        schema_registry.register_schema(
+            name="auth",
+            description="Authentication and user management",
+            models=["auth.User", "auth.Group"],
+            exclude_models=["auth.Permission"],
+            settings={
+                "enable_graphiql": True,
+                "authentication_required": False,
+                "schema_settings": {
+                    "disable_security_mutations": False,
+                },
+            },
+            enabled=True,
+        )
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.25 on 2026-10-15 14:30
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_auditeventmodel_error_message_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="auditeventmodel",
+            name="timestamp",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddIndex(
+            model_name="auditeventmodel",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["timestamp"],
+                name="audit_events_timestamp_brin",
+                pages_per_range=32,
+            ),
+        ),
+    ]
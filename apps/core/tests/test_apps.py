@@ -0,0 +1,16 @@
+"""
+Tests for the core app configuration.
+"""
+
+from django.apps import apps
+from django.test import SimpleTestCase
+
+
+class CoreConfigTestCase(SimpleTestCase):
+    """Test that GraphQL schemas are registered early enough."""
+
+    def test_core_is_ready_before_the_graphql_library(self):
+        """Schemas must be registered before rail_django_graphql's ready()."""
+        names = [config.name for config in apps.get_app_configs()]
+
+        self.assertLess(names.index("apps.core"), names.index("rail_django_graphql"))
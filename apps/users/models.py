@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils.functional import cached_property
 
 
 class User(AbstractUser):
@@ -17,6 +18,13 @@ class User(AbstractUser):
 
     desc.fget.short_description = ""
 
+    @cached_property
+    def roles_set(self):
+        """Role names as a frozenset, normalized once per user instance."""
+        return frozenset(
+            getattr(role, "value", role) for role in getattr(self, "roles", ())
+        )
+
 
 class UserProfile(models.Model):
     """User profile model with OneToOne relationship to User."""
@@ -2,29 +2,25 @@
 Development settings for django-graphql-boilerplate project (env-driven).
 """
 
-import environ
-
 from .base import *
 
-env = environ.Env()
-
 # Development toggles
 DEBUG = env.bool("DJANGO_DEBUG", default=True)
 ALLOWED_HOSTS = env.list("DJANGO_ALLOWED_HOSTS", default=["localhost", "127.0.0.1"])
 
 # GraphiQL and introspection (development overrides)
-RAIL_DJANGO_GRAPHQL["ENABLE_GRAPHIQL"] = env.bool("ENABLE_GRAPHIQL", default=True)
-RAIL_DJANGO_GRAPHQL["enable_introspection"] = env.bool(
-    "enable_introspection", default=True
-)
+_enable_graphiql = env.bool("ENABLE_GRAPHIQL", default=True)
+_enable_introspection = env.bool("enable_introspection", default=True)
+RAIL_DJANGO_GRAPHQL["ENABLE_GRAPHIQL"] = _enable_graphiql
+RAIL_DJANGO_GRAPHQL["enable_introspection"] = _enable_introspection
 
 # Override schema-specific settings for development
-RAIL_DJANGO_GRAPHQL["SCHEMAS"]["default"]["schema_settings"]["enable_graphiql"] = (
-    env.bool("ENABLE_GRAPHIQL", default=True)
-)
-RAIL_DJANGO_GRAPHQL["SCHEMAS"]["default"]["schema_settings"]["enable_introspection"] = (
-    env.bool("enable_introspection", default=True)
-)
+RAIL_DJANGO_GRAPHQL["SCHEMAS"]["default"]["schema_settings"][
+    "enable_graphiql"
+] = _enable_graphiql
+RAIL_DJANGO_GRAPHQL["SCHEMAS"]["default"]["schema_settings"][
+    "enable_introspection"
+] = _enable_introspection
 
 # Email backend for development
 EMAIL_BACKEND = env(
@@ -5,45 +5,30 @@ Production settings for django-graphql-boilerplate project (env-driven).
 import os
 from pathlib import Path
 
-import environ
-
 from .base import *
 
-env = environ.Env()
-
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = env.bool("DJANGO_DEBUG", default=False)
 
 ALLOWED_HOSTS = env.list("DJANGO_ALLOWED_HOSTS", default=[])
 
-DATABASES = {"default": env.db("DATABASE_URL")}
-
-_redis_url = env("REDIS_URL", default=None)
-if _redis_url:
-    CACHES = {
-        "default": {
-            "BACKEND": "django_redis.cache.RedisCache",
-            "LOCATION": _redis_url,
-            "OPTIONS": {
-                "CLIENT_CLASS": "django_redis.client.DefaultClient",
-                "IGNORE_EXCEPTIONS": True,
-            },
-        }
-    }
+# DATABASE_URL has no fallback in production; the connection pooling
+# options and the REDIS_URL cache are already read by base.py
+DATABASES["default"].update(env.db("DATABASE_URL"))
 
 # Security toggles (production overrides)
-RAIL_DJANGO_GRAPHQL["ENABLE_GRAPHIQL"] = env.bool("ENABLE_GRAPHIQL", default=False)
-RAIL_DJANGO_GRAPHQL["enable_introspection"] = env.bool(
-    "enable_introspection", default=False
-)
+_enable_graphiql = env.bool("ENABLE_GRAPHIQL", default=False)
+_enable_introspection = env.bool("enable_introspection", default=False)
+RAIL_DJANGO_GRAPHQL["ENABLE_GRAPHIQL"] = _enable_graphiql
+RAIL_DJANGO_GRAPHQL["enable_introspection"] = _enable_introspection
 
 # Override schema-specific settings for production
-RAIL_DJANGO_GRAPHQL["SCHEMAS"]["default"]["schema_settings"]["enable_graphiql"] = (
-    env.bool("ENABLE_GRAPHIQL", default=False)
-)
-RAIL_DJANGO_GRAPHQL["SCHEMAS"]["default"]["schema_settings"]["enable_introspection"] = (
-    env.bool("enable_introspection", default=False)
-)
+RAIL_DJANGO_GRAPHQL["SCHEMAS"]["default"]["schema_settings"][
+    "enable_graphiql"
+] = _enable_graphiql
+RAIL_DJANGO_GRAPHQL["SCHEMAS"]["default"]["schema_settings"][
+    "enable_introspection"
+] = _enable_introspection
 
 STATIC_ROOT = Path(env("STATIC_ROOT", default="/app/static/"))
 MEDIA_ROOT = Path(env("MEDIA_ROOT", default="/app/media/"))
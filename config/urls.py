@@ -16,21 +16,17 @@ from rail_django_graphql.views.graphql_views import (
     SchemaListView,
 )
 
+_GRAPHIQL_ENABLED = settings.RAIL_DJANGO_GRAPHQL.get("SECURITY", {}).get(
+    "ENABLE_GRAPHIQL", False
+)
+_graphql_view = csrf_exempt(GraphQLView.as_view(graphiql=_GRAPHIQL_ENABLED))
+
 urlpatterns = [
     path("api/", include("rail_django_graphql.api.urls")),
     path("admin/", admin.site.urls),
     path("", TemplateView.as_view(template_name="index.html"), name="home"),
     # GraphQL endpoint (library view)
-    path(
-        "graphql/",
-        csrf_exempt(
-            GraphQLView.as_view(
-                graphiql=settings.RAIL_DJANGO_GRAPHQL["SECURITY"].get(
-                    "ENABLE_GRAPHIQL", False
-                )
-            )
-        ),
-    ),
+    path("graphql/", _graphql_view),
     # Health check endpoints
     path("", include(health_urlpatterns)),
     # App URLs